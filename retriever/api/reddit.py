@@ -6,22 +6,37 @@
 
 ## Standard Libary
 import os
+import re
 import sys
 import json
 import pytz
+import random
+import functools
 import pkgutil
 import datetime
 import requests
-from time import sleep
-from collections import Counter
+import threading
+from time import sleep, time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 ## External Libaries
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from praw import Reddit as praw_api
+from praw.models import MoreComments
 from prawcore import ResponseException, OAuthException
 from psaw import PushshiftAPI as psaw_api
+## The psaw package re-exports the PushshiftAPI class under the module name,
+## so grab the underlying module (where the transport lives) from sys.modules
+_psaw_internals = sys.modules["psaw.PushshiftAPI"]
+
+## External (Optional)
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 ## Local
 from ..util.helpers import chunks
@@ -34,12 +49,400 @@ from ..util.logging import get_logger
 ## Default Maximum Number of Results
 REQUEST_LIMIT = 100000
 
-## Config File
-try:
-    CONFIG = json.loads(pkgutil.get_data(__name__, "/../config.json"))
-    CONFIG = CONFIG.get("reddit", None)
-except FileNotFoundError:
-    CONFIG = None
+## Maximum Number of link_ids Pushshift Accepts in One Comment Query
+MAX_LINK_IDS_PER_REQUEST = 1000
+
+## Submission ID Parser (Matches Raw IDs, t3_-prefixed IDs, and Full URLs)
+_SUBMISSION_ID_RE = re.compile(r"(?:/comments/|^t3_)([a-z0-9]+)|^([a-z0-9]+)$", re.IGNORECASE)
+
+## Variables of Interest (Submissions)
+SUBMISSION_VARS = ("archived",
+                   "author",
+                   "author_flair_text",
+                   "author_flair_type",
+                   "author_fullname",
+                   "category",
+                   "comment_limit",
+                   "content_categories",
+                   "created_utc",
+                   "crosspost_parent",
+                   "domain",
+                   "discussion_type",
+                   "distinguished",
+                   "downs",
+                   "full_link",
+                   "gilded",
+                   "id",
+                   "is_meta",
+                   "is_original_content",
+                   "is_reddit_media_domain",
+                   "is_self",
+                   "is_video",
+                   "link_flair_text",
+                   "link_flair_type",
+                   "locked",
+                   "media",
+                   "num_comments",
+                   "num_crossposts",
+                   "num_duplicates",
+                   "num_reports",
+                   "over_18",
+                   "permalink",
+                   "score",
+                   "selftext",
+                   "subreddit",
+                   "subreddit_id",
+                   "thumbnail",
+                   "title",
+                   "url",
+                   "ups",
+                   "upvote_ratio")
+
+## Variables of Interest (Comments)
+COMMENT_VARS = ("author",
+                "author_flair_text",
+                "author_flair_type",
+                "author_fullname",
+                "body",
+                "collapsed",
+                "collapsed_reason",
+                "controversiality",
+                "created_utc",
+                "downs",
+                "edited",
+                "gildings",
+                "id",
+                "is_submitter",
+                "link_id",
+                "locked",
+                "parent_id",
+                "permalink",
+                "stickied",
+                "subreddit",
+                "subreddit_id",
+                "score",
+                "score_hidden",
+                "total_awards_received",
+                "ups")
+
+## Variables of Interest (Subreddit Metadata)
+METADATA_COLUMNS = ("display_name",
+                    "restrict_posting",
+                    "wiki_enabled",
+                    "title",
+                    "primary_color",
+                    "active_user_count",
+                    "display_name_prefixed",
+                    "accounts_active",
+                    "public_traffic",
+                    "subscribers",
+                    "name",
+                    "quarantine",
+                    "hide_ads",
+                    "emojis_enabled",
+                    "advertiser_category",
+                    "public_description",
+                    "spoilers_enabled",
+                    "all_original_content",
+                    "key_color",
+                    "created",
+                    "submission_type",
+                    "allow_videogifs",
+                    "allow_polls",
+                    "collapse_deleted_comments",
+                    "allow_discovery",
+                    "link_flair_enabled",
+                    "subreddit_type",
+                    "suggested_comment_sort",
+                    "id",
+                    "over18",
+                    "description",
+                    "restrict_commenting",
+                    "allow_images",
+                    "lang",
+                    "whitelist_status",
+                    "url",
+                    "created_utc")
+
+## Explicit Column dtypes (Nullable Types Tolerate Missing Fields)
+SUBMISSION_DTYPES = {"created_utc":"Int64",
+                     "score":"Int64",
+                     "downs":"Int64",
+                     "ups":"Int64",
+                     "gilded":"Int64",
+                     "num_comments":"Int64",
+                     "num_crossposts":"Int64",
+                     "num_duplicates":"Int64",
+                     "num_reports":"Int64",
+                     "upvote_ratio":"float64"}
+
+COMMENT_DTYPES = {"created_utc":"Int64",
+                  "score":"Int64",
+                  "downs":"Int64",
+                  "ups":"Int64",
+                  "controversiality":"Int64",
+                  "total_awards_received":"Int64"}
+
+## Low-cardinality String Columns (Stored as category Instead of object)
+CATEGORICAL_COLS = {"subreddit",
+                    "author_flair_type",
+                    "link_flair_type",
+                    "distinguished",
+                    "thumbnail",
+                    "subreddit_type",
+                    "domain",
+                    "discussion_type",
+                    "whitelist_status",
+                    "lang"}
+
+## Boolean Columns (Stored as Nullable boolean Instead of object)
+BOOL_COLS = {"archived",
+             "is_meta",
+             "is_original_content",
+             "is_reddit_media_domain",
+             "is_self",
+             "is_video",
+             "locked",
+             "over_18",
+             "score_hidden",
+             "is_submitter",
+             "stickied",
+             "collapsed"}
+
+## Shared PRAW Instance (Reused Across Wrapper Objects)
+_PRAW_SINGLETON = None
+_PRAW_SINGLETON_LOCK = threading.Lock()
+
+## Shared Pushshift Transport (Keep-alive Connection Pool)
+_PSAW_TRANSPORT_LOCK = threading.Lock()
+
+#####################
+### Helpers
+#####################
+
+class _RateLimiter(object):
+
+    """
+    Thread-safe sliding-window rate limiter with response-header
+    feedback. Proactively caps the request rate per minute and, when
+    the provider signals throttling (Retry-After or an exhausted
+    x-ratelimit-remaining), pauses all callers until the reset.
+    """
+
+    def __init__(self,
+                 max_per_minute=60):
+        """
+        Args:
+            max_per_minute (int): Maximum requests allowed per sliding minute
+        """
+        self._max_per_minute = max_per_minute
+        self._timestamps = deque()
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """
+        Block until a request may be issued under the current limits.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            with self._lock:
+                now = time()
+                if now >= self._pause_until:
+                    while self._timestamps and now - self._timestamps[0] >= 60:
+                        self._timestamps.popleft()
+                    if len(self._timestamps) < self._max_per_minute:
+                        self._timestamps.append(now)
+                        return
+                    delay = 60 - (now - self._timestamps[0])
+                else:
+                    delay = self._pause_until - now
+            sleep(delay)
+
+    def update(self,
+               headers):
+        """
+        Record provider feedback from response headers.
+
+        Args:
+            headers (Mapping or None): Response headers
+
+        Returns:
+            None
+        """
+        if headers is None:
+            return
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        with self._lock:
+            try:
+                if retry_after is not None:
+                    self._pause_until = max(self._pause_until, time() + float(retry_after))
+                elif remaining is not None and reset is not None and float(remaining) < 1:
+                    self._pause_until = max(self._pause_until, time() + float(reset))
+            except (TypeError, ValueError):
+                pass
+
+## Shared Limiter for All Direct Pushshift Traffic
+PUSHSHIFT_RATE_LIMIT_PER_MINUTE = 60
+_RATE_LIMITER = _RateLimiter(PUSHSHIFT_RATE_LIMIT_PER_MINUTE)
+
+class _PooledTransport(object):
+
+    """
+    Minimal stand-in for the requests module used inside PSAW. Routes
+    GETs through a shared keep-alive session so repeated Pushshift
+    requests reuse pooled TLS connections instead of opening a fresh
+    one per call.
+    """
+
+    ConnectionError = requests.ConnectionError
+
+    def __init__(self,
+                 session):
+        """
+        Args:
+            session (requests Session): Session with a widened adapter pool
+        """
+        self._session = session
+
+    def get(self,
+            url,
+            **kwargs):
+        """
+        Forward a GET to the pooled session, gated by the shared
+        rate limiter.
+        """
+        _RATE_LIMITER.wait()
+        resp = self._session.get(url, **kwargs)
+        _RATE_LIMITER.update(getattr(resp, "headers", None))
+        return resp
+
+def _install_pooled_transport():
+    """
+    Swap PSAW's module-level requests reference for a pooled transport.
+    Idempotent; lock-guarded for the first installation.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    with _PSAW_TRANSPORT_LOCK:
+        if isinstance(_psaw_internals.requests, _PooledTransport):
+            return
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16,
+                                                pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _psaw_internals.requests = _PooledTransport(session)
+
+@functools.lru_cache(maxsize=1)
+def _load_config():
+    """
+    Load Reddit API credentials from the packaged config.json. Parsed
+    lazily on first use (PSAW-only consumers never pay the disk I/O)
+    and cached for subsequent calls.
+
+    Args:
+        None
+
+    Returns:
+        config (dict or None): Reddit credentials (None if config.json is missing)
+    """
+    try:
+        config = json.loads(pkgutil.get_data(__name__, "/../config.json"))
+    except FileNotFoundError:
+        return None
+    return config.get("reddit", None)
+
+def _get_praw_instance():
+    """
+    Get the shared PRAW instance, initializing it on first use. Reusing
+    a single instance shares the HTTPS keep-alive pool and OAuth token
+    across all Reddit wrapper objects.
+
+    Args:
+        None
+
+    Returns:
+        praw (PRAW instance): Shared authenticated PRAW API object
+    """
+    global _PRAW_SINGLETON
+    with _PRAW_SINGLETON_LOCK:
+        if _PRAW_SINGLETON is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=20,
+                                                    pool_maxsize=20)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _PRAW_SINGLETON = praw_api(**_load_config(),
+                                       requestor_kwargs={"session":session})
+        return _PRAW_SINGLETON
+
+def _narrow_fields(fields,
+                   cols):
+    """
+    Narrow the canonical field tuple to a requested column subset,
+    always retaining created_utc (the sort key).
+
+    Args:
+        fields (tuple of str): Canonical field tuple
+        cols (list or None): Requested columns (None keeps all fields)
+
+    Returns:
+        fields (tuple of str): Fields to extract per row
+    """
+    if cols is None:
+        return fields
+    return tuple(f for f in fields if f in cols or f == "created_utc")
+
+def _cacheable_url(url):
+    """
+    Decide whether a GET may be served from the response cache. Only
+    stable, repeat-queried endpoints qualify: subreddit/user metadata
+    lookups (/about) and the size=0 aggregation count preflights. Live
+    search traffic must never be served stale.
+
+    Args:
+        url (str or None): Full request URL, including the query string
+
+    Returns:
+        cacheable (bool): True if the response may be cached
+    """
+    if not url:
+        return False
+    if "size=0" in url and "aggs" in url:
+        return True
+    if "/about" in url:
+        return True
+    return False
+
+def _next_backoff(current,
+                  cap=60.0,
+                  base=2.0):
+    """
+    Compute the next retry delay using capped exponential backoff with
+    jitter. The cap bounds worst-case wait per retry and the jitter
+    decorrelates concurrent clients hitting the same rate-limit window.
+
+    Args:
+        current (float): Current backoff in seconds
+        cap (float): Maximum backoff in seconds (before jitter)
+        base (float): Exponential growth factor
+
+    Returns:
+        backoff (float): Next backoff in seconds
+    """
+    return min(cap, current * base) * (1 + random.random() * 0.25)
 
 #####################
 ### Wrapper
@@ -55,6 +458,8 @@ class Reddit(object):
                  init_praw=False,
                  max_retries=3,
                  backoff=2,
+                 num_workers=8,
+                 cache_expire_after=3600,
                  logger=None):
         """
         Initialize a class to retrieve Reddit data based on
@@ -67,14 +472,22 @@ class Reddit(object):
                     in home directory
             max_retries (int): Maximum number of query attempts before
                                returning null result
-            backoff (int): Baseline number of seconds between failed 
+            backoff (int): Baseline number of seconds between failed
                            query attempts. Increases exponentially with
                            each failed query attempt
+            num_workers (int): Maximum number of concurrent time-chunk
+                               queries issued against Pushshift.io
+            cache_expire_after (int or None): Seconds to cache repeated HTTP GETs
+                               (e.g. subreddit metadata) on disk. Requires the
+                               optional requests-cache package. None disables caching.
             logger (Logger): python Logger to use other than default stdout INFO logger.
         
         Returns:
             None
         """
+        ## Validate Parameters
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1")
         ## Class Attributes
         ## Initialize logging
         if logger:
@@ -84,10 +497,25 @@ class Reddit(object):
         self._init_praw = init_praw
         self._max_retries = max_retries
         self._backoff = backoff
-        ## Initialize APIs
+        self._num_workers = num_workers
+        self._cache_expire_after = cache_expire_after
+        ## Initialize APIs (Installs the Response Cache First)
         self._initialize_api_wrappers()
+        ## Shared Keep-alive Session for Direct Pushshift Calls. Created
+        ## After the Cache Install: requests-cache Only Patches Sessions
+        ## Constructed After It, and the Doc-count Preflights Rely on It
+        self._http = requests.Session()
+        self._http.mount("https://",
+                         requests.adapters.HTTPAdapter(pool_connections=16,
+                                                       pool_maxsize=16,
+                                                       max_retries=0))
+        ## Precompute Row Extractors (Avoids Per-row Branching During Parsing)
+        self._submission_extractors = [(d, self._make_extractor(d)) for d in SUBMISSION_VARS]
+        self._comment_extractors = [(d, self._make_extractor(d)) for d in COMMENT_VARS]
+        ## Per-instance LRU Cache Over PRAW Subreddit Lookups (Deduplicates /about/ Fetches)
+        self._subreddit = functools.lru_cache(maxsize=10000)(self._subreddit_uncached)
+
 
-    
     def __repr__(self):
         """
         Print a description of the class state.
@@ -111,25 +539,172 @@ class Reddit(object):
         Returns:
             None. Sets class api attribute.
         """
-        if hasattr(self, "_init_praw") and self._init_praw and CONFIG is not None:
-            ## Initialize PRAW API
-            self._praw = praw_api(**CONFIG)
+        ## Install HTTP Response Cache (Short-circuits Repeated Metadata/Preflight GETs)
+        self._initialize_response_cache()
+        ## Route Pushshift GETs Through a Shared Keep-alive Connection Pool
+        _install_pooled_transport()
+        ## PSAW Clients Are Thread-local (Built Lazily by the api Property);
+        ## Only the PRAW Handle to Wrap Them Around Is Resolved Here
+        self._api_local = threading.local()
+        self._psaw_praw = None
+        if self._init_praw and _load_config() is not None:
+            ## Initialize PRAW API (Shared Across Wrapper Objects)
+            self._praw = _get_praw_instance()
             ## Authenticate Credentials
             authenticated = self._authenticated(self._praw)
             ## Initialize Pushshift API around PRAW API
             if authenticated:
                 self.logger.info(f"Reddit credentials authenticated. Using PRAW API.")
-                self.api = psaw_api(self._praw, max_results_per_request=100)
+                self._psaw_praw = self._praw
             else:
                 self.logger.warning("Reddit API credentials invalid. Defaulting to Pushshift.io API")
                 self._init_praw = False
-                self.api = psaw_api(max_results_per_request=100)
         else:
             ## Initialize API Objects
             if self._init_praw:
                 self._init_praw = False
                 self.logger.warning("Reddit API credentials not detected. Defaulting to Pushshift.io API")
-            self.api = psaw_api(max_results_per_request=100)
+
+    @property
+    def api(self):
+        """
+        Thread-local PSAW client. PSAW keeps paging state on the
+        instance (the query payload is stored and mutated between
+        pages), so concurrent generators sharing one client would
+        corrupt each other's queries. Each worker thread lazily gets
+        its own client; connection reuse and rate capping remain
+        centralized in the shared pooled transport and rate limiter.
+        The explicit rate limit also skips PSAW's per-client /meta
+        probe at construction.
+
+        Args:
+            None
+
+        Returns:
+            client (PSAW instance): This thread's Pushshift client
+        """
+        client = getattr(self._api_local, "client", None)
+        if client is None:
+            if self._psaw_praw is not None:
+                client = psaw_api(self._psaw_praw,
+                                  max_results_per_request=100,
+                                  rate_limit_per_minute=PUSHSHIFT_RATE_LIMIT_PER_MINUTE)
+            else:
+                client = psaw_api(max_results_per_request=100,
+                                  rate_limit_per_minute=PUSHSHIFT_RATE_LIMIT_PER_MINUTE)
+            self._api_local.client = client
+        return client
+
+    def _subreddit_uncached(self,
+                            name):
+        """
+        Resolve a PRAW Subreddit object by display name. Wrapped by a
+        per-instance LRU cache at initialization so PRAW's lazy
+        /r/<name>/about/ fetch happens at most once per name.
+
+        Args:
+            name (str): Subreddit display name
+
+        Returns:
+            subreddit (praw Subreddit): Lazy PRAW subreddit object
+        """
+        return self._praw.subreddit(name)
+
+    def _initialize_response_cache(self):
+        """
+        Install a disk-backed cache for HTTP GET responses. The install
+        patches requests process-wide, so caching is scoped through a
+        filter to the stable endpoints only (metadata lookups and the
+        size=0 count preflights); live search GETs always go to the
+        network. No-op if requests-cache is not installed or caching is
+        disabled.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if requests_cache is None:
+            return
+        if not self._cache_expire_after:
+            return
+        requests_cache.install_cache("reddit_cache",
+                                     backend="sqlite",
+                                     expire_after=self._cache_expire_after,
+                                     allowable_methods=("GET",),
+                                     filter_fn=lambda response: _cacheable_url(getattr(response, "url", None)))
+
+    def invalidate_cache(self,
+                         url_filter=None):
+        """
+        Clear cached HTTP responses installed by the response cache.
+
+        Args:
+            url_filter (str or None): If provided, only remove cached
+                    responses whose URL contains this substring (e.g.
+                    a subreddit name). Otherwise, clear the full cache.
+
+        Returns:
+            None
+        """
+        if requests_cache is None:
+            return
+        cache = requests_cache.get_cache()
+        if cache is None:
+            return
+        if url_filter is None:
+            cache.clear()
+        else:
+            matches = [u for u in cache.urls() if url_filter.lower() in u.lower()]
+            if matches:
+                cache.delete(urls=matches)
+
+    def _make_extractor(self,
+                        field):
+        """
+        Construct a single-field extractor function for response objects.
+        PRAW-backed responses carry Redditor/Subreddit objects that require
+        normalization; Pushshift responses do not. Timestamps are cast
+        in bulk after DataFrame construction instead of per row.
+
+        Args:
+            field (str): Name of the response attribute to extract
+
+        Returns:
+            extractor (callable): Maps a response object (and an optional
+                    per-pass memo dict) to the field value (or None). The memo
+                    caches resolved author/subreddit names by object identity,
+                    since resolving them on a lazy PRAW object can trigger an
+                    HTTP round-trip.
+        """
+        init_praw = self._init_praw
+        if init_praw and field == "author":
+            def extractor(r, memo=None):
+                d_obj = getattr(r, "author", None)
+                if d_obj is None:
+                    return None
+                if memo is None:
+                    return d_obj.name
+                key = ("author", id(d_obj))
+                if key not in memo:
+                    memo[key] = d_obj.name
+                return memo[key]
+        elif init_praw and field == "subreddit":
+            def extractor(r, memo=None):
+                d_obj = getattr(r, "subreddit", None)
+                if d_obj is None:
+                    return None
+                if memo is None:
+                    return d_obj.display_name
+                key = ("subreddit", id(d_obj))
+                if key not in memo:
+                    memo[key] = d_obj.display_name
+                return memo[key]
+        else:
+            def extractor(r, memo=None, _field=field):
+                return getattr(r, _field, None)
+        return extractor
 
     def _authenticated(self,
                        reddit):
@@ -236,216 +811,339 @@ class Reddit(object):
             time_chunks = [start_epoch, end_epoch]
         else:
             time_chunksize = self._parse_date_frequency(chunksize)
-            time_chunks = [start_epoch]
-            while time_chunks[-1] < end_epoch:
-                time_chunks.append(min(time_chunks[-1] + time_chunksize, end_epoch))
+            n_time_chunks = int(np.ceil((end_epoch - start_epoch) / time_chunksize))
+            time_chunks = np.minimum(start_epoch + np.arange(n_time_chunks + 1) * time_chunksize,
+                                     end_epoch).tolist()
         return time_chunks
-    
+
+    def _query_time_chunks(self,
+                           chunk_query,
+                           time_chunks,
+                           **kwargs):
+        """
+        Issue independent time-chunk queries concurrently through a
+        bounded thread pool. Each chunk is an isolated HTTP request
+        against Pushshift, so the pool size caps in-flight requests.
+
+        Args:
+            chunk_query (callable): Function accepting (tcstart, tcstop, **kwargs)
+                    and returning per-chunk results (records or DataFrame) or None
+            time_chunks (list of int): Epoch boundaries from _chunk_timestamps
+            **kwargs: Additional keyword arguments for chunk_query
+
+        Returns:
+            results (list): Non-empty chunk results (unordered)
+        """
+        workers = self._num_workers
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(chunk_query, tcstart, tcstop, **kwargs)
+                       for tcstart, tcstop in zip(time_chunks[:-1], time_chunks[1:])]
+            for future in as_completed(futures):
+                res = future.result()
+                if res is not None and len(res) > 0:
+                    results.append(res)
+        return results
+
+    def _query_submission_chunk(self,
+                                tcstart,
+                                tcstop,
+                                subreddit,
+                                limit=None,
+                                cols=None):
+        """
+        Query a single time chunk of subreddit submissions with retries.
+
+        Args:
+            tcstart (int): Start of the chunk (epoch)
+            tcstop (int): End of the chunk (epoch)
+            subreddit (str): Canonical name of the subreddit
+            limit (int or None): Maximum number of submissions to retrieve
+            cols (list or None): Optional Filters
+
+        Returns:
+            records (list of dict or None): Parsed chunk rows (None on repeated failure)
+        """
+        backoff = self._backoff
+        retries = self._max_retries
+        for _ in range(retries):
+            try:
+                ## Construct Call
+                query_params = dict(after=tcstart,
+                                    before=tcstop+1,
+                                    subreddit=subreddit,
+                                    limit=limit)
+                if cols is not None:
+                    query_params["filter"] = cols
+                req = self.api.search_submissions(**query_params)
+                ## Retrieve and Parse Data
+                return self._parse_psaw_submission_request(req, as_records=True, cols=cols)
+            except Exception as e:
+                backoff = self._sleep_before_retry(backoff, error=e)
+        return None
+
+
+    def _sleep_before_retry(self,
+                            backoff,
+                            error=None,
+                            response=None):
+        """
+        Sleep ahead of a retry attempt. Honors a server-provided
+        Retry-After header (e.g. on 429 responses) when one is
+        available, otherwise sleeps for the current backoff value.
+
+        Args:
+            backoff (float): Current backoff in seconds
+            error (Exception or None): Exception that triggered the retry
+            response (requests Response or None): Response that triggered the retry
+
+        Returns:
+            backoff (float): Backoff to use before the next attempt
+        """
+        if response is None:
+            response = getattr(error, "response", None)
+        retry_after = None
+        if response is not None:
+            retry_after = getattr(response, "headers", {}).get("Retry-After")
+        delay = backoff
+        next_backoff = _next_backoff(backoff)
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+                next_backoff = backoff
+            except (TypeError, ValueError):
+                pass
+        if error is not None:
+            self.logger.warning(f"Request failed with {type(error).__name__}: {error}. Retrying in {delay:.1f} seconds")
+        sleep(delay)
+        return next_backoff
+
+    def _count(self,
+               endpoint,
+               **params):
+        """
+        Count documents matching a Pushshift query with one direct HTTP
+        call. Requests zero documents (size=0) and reads the aggregation
+        buckets, so no PSAW generator or paging machinery is involved,
+        and the GET can be served by the response cache.
+
+        Args:
+            endpoint (str): "submission" or "comment"
+            **params: Query parameters (e.g. subreddit, author, after, before)
+
+        Returns:
+            count (int): Number of matching documents
+        """
+        aggs = params.pop("aggs", "subreddit")
+        url = f"https://api.pushshift.io/reddit/search/{endpoint}/"
+        _RATE_LIMITER.wait()
+        resp = self._http.get(url, params={**params, "size":0, "aggs":aggs})
+        _RATE_LIMITER.update(resp.headers)
+        resp.raise_for_status()
+        buckets = resp.json().get("aggs", {}).get(aggs, [])
+        count = sum(b.get("doc_count", 0) for b in buckets)
+        return count
+
+    def _sort_by_created_utc(self,
+                             df):
+        """
+        Sort rows by created_utc via a single numpy argsort over the key
+        column. Cheaper than DataFrame.sort_values for one numeric key,
+        and resets the index in the same step. Missing timestamps sort
+        last, matching the sort_values default.
+
+        Args:
+            df (pandas DataFrame): Parsed submission/comment data
+
+        Returns:
+            df (pandas DataFrame): Data sorted by created_utc
+        """
+        if len(df) == 0:
+            return df
+        key = df["created_utc"].to_numpy(dtype="float64", na_value=np.nan)
+        order = np.argsort(key, kind="stable")
+        return df.take(order).reset_index(drop=True)
+
+    def _optimize_dtypes(self,
+                         df,
+                         dtypes=None):
+        """
+        Apply the explicit column dtype schema: numeric columns get typed
+        nullable dtypes, low-cardinality string columns become category,
+        and boolean flags use the nullable boolean dtype. One typed-casting
+        pass avoids the per-column object-block consolidation pandas does
+        when left to infer, and cuts the memory footprint of large pulls.
+
+        Args:
+            df (pandas DataFrame): Parsed submission/comment data
+            dtypes (dict or None): Numeric column schema
+                    (e.g. SUBMISSION_DTYPES or COMMENT_DTYPES)
+
+        Returns:
+            df (pandas DataFrame): Data with compacted column dtypes
+        """
+        schema = {}
+        if dtypes is not None:
+            schema.update({c:d for c, d in dtypes.items() if c in df.columns})
+        schema.update({c:"category" for c in CATEGORICAL_COLS & set(df.columns)})
+        schema.update({c:"boolean" for c in BOOL_COLS & set(df.columns)})
+        for c, dtype in schema.items():
+            try:
+                df[c] = df[c].astype(dtype)
+            except (TypeError, ValueError):
+                continue
+        return df
+
     def _parse_psaw_submission_request(self,
-                                       request):
+                                       request,
+                                       as_records=False,
+                                       cols=None):
         """
-        Retrieve submission search data and format into 
+        Retrieve submission search data and format into
         a standard pandas dataframe format
 
         Args:
             request (generator): self.api.search_submissions response
-        
+            as_records (bool): If True, return raw row dictionaries instead
+                    of a DataFrame (callers batching multiple chunks can then
+                    build a single DataFrame at the end)
+            cols (list or None): If provided, only extract these fields
+                    (created_utc is always retained for sorting)
+
         Returns:
-            df (pandas DataFrame): Submission search data
-        """
-        ## Define Variables of Interest
-        data_vars = ["archived",
-                     "author",
-                     "author_flair_text",
-                     "author_flair_type",
-                     "author_fullname",
-                     "category",
-                     "comment_limit",
-                     "content_categories",
-                     "created_utc",
-                     "crosspost_parent",
-                     "domain",
-                     "discussion_type",
-                     "distinguished",
-                     "downs",
-                     "full_link",
-                     "gilded",
-                     "id",
-                     "is_meta",
-                     "is_original_content",
-                     "is_reddit_media_domain",
-                     "is_self",
-                     "is_video",
-                     "link_flair_text",
-                     "link_flair_type",
-                     "locked",
-                     "media",
-                     "num_comments",
-                     "num_crossposts",
-                     "num_duplicates",
-                     "num_reports",
-                     "over_18",
-                     "permalink",
-                     "score",
-                     "selftext",
-                     "subreddit",
-                     "subreddit_id",
-                     "thumbnail",
-                     "title",
-                     "url",
-                     "ups",
-                     "upvote_ratio"]
-        ## Parse Data
-        response_formatted = []
-        for r in request:
-            r_data = {}
-            if not hasattr(self, "_init_praw") or not self._init_praw:
-                for d in data_vars:
-                    r_data[d] = None
-                    if hasattr(r, d):
-                        r_data[d] = getattr(r, d)
-            else:
-                for d in data_vars:
-                    r_data[d] = None
-                    if hasattr(r, d):
-                        d_obj = getattr(r, d)
-                        if d_obj is None:
-                            continue
-                        if d == "author":
-                            d_obj = d_obj.name
-                        if d == "created_utc":
-                            d_obj = int(d_obj)
-                        if d == "subreddit":
-                            d_obj = d_obj.display_name
-                        r_data[d] = d_obj
-            response_formatted.append(r_data)
+            df (pandas DataFrame or list of dict): Submission search data
+        """
+        ## Define Variables of Interest (Narrowed to Requested Columns)
+        data_vars = _narrow_fields(SUBMISSION_VARS, cols)
+        ## Row Extractors (Precomputed at Initialization)
+        extractors = self._submission_extractors
+        if cols is not None:
+            extractors = [(name, fn) for name, fn in extractors if name in data_vars]
+        ## Row Generator (Avoids Materializing Response Twice)
+        ## The memo deduplicates lazy author/subreddit resolution within this pass
+        def _iter(request):
+            memo = {}
+            for r in request:
+                yield {name: fn(r, memo) for name, fn in extractors}
+        ## Optionally Return Raw Records
+        if as_records:
+            return list(_iter(request))
         ## Format into DataFrame
-        df = pd.DataFrame(response_formatted)
+        df = pd.DataFrame(_iter(request), columns=data_vars)
         if len(df) > 0:
-            df = df.sort_values("created_utc", ascending=True)
-            df = df.reset_index(drop=True)
+            df = self._optimize_dtypes(df, SUBMISSION_DTYPES)
+            df = self._sort_by_created_utc(df)
         return df
     
     def _parse_psaw_comment_request(self,
-                                    request):
+                                    request,
+                                    as_records=False,
+                                    cols=None):
         """
         Retrieve comment search data and format into 
         a standard pandas dataframe format
 
         Args:
             request (generator): self.api.search_comments response
-        
+            as_records (bool): If True, return raw row dictionaries instead
+                    of a DataFrame
+            cols (list or None): If provided, only extract these fields
+                    (created_utc is always retained for sorting)
+
         Returns:
-            df (pandas DataFrame): Comment search data
+            df (pandas DataFrame or list of dict): Comment search data
         """
-        ## Define Variables of Interest
-        data_vars = [
-                    "author",
-                    "author_flair_text",
-                    "author_flair_type",
-                    "author_fullname",
-                    "body",
-                    "collapsed",
-                    "collapsed_reason",
-                    "controversiality",
-                    "created_utc",
-                    "downs",
-                    "edited",
-                    "gildings",
-                    "id",
-                    "is_submitter",
-                    "link_id",
-                    "locked",
-                    "parent_id",
-                    "permalink",
-                    "stickied",
-                    "subreddit",
-                    "subreddit_id",
-                    "score",
-                    "score_hidden",
-                    "total_awards_received",
-                    "ups"
-        ]
-        ## Parse Data
-        response_formatted = []
-        for r in request:
-            r_data = {}
-            if not hasattr(self, "_init_praw") or not self._init_praw:
-                for d in data_vars:
-                    r_data[d] = None
-                    if hasattr(r, d):
-                        r_data[d] = getattr(r, d)
-            else:
-                for d in data_vars:
-                    r_data[d] = None
-                    if hasattr(r, d):
-                        d_obj = getattr(r, d)
-                        if d_obj is None:
-                            continue
-                        if d == "author":
-                            d_obj = d_obj.name
-                        if d == "created_utc":
-                            d_obj = int(d_obj)
-                        if d == "subreddit":
-                            d_obj = d_obj.display_name
-                        r_data[d] = d_obj
-            response_formatted.append(r_data)
+        ## Define Variables of Interest (Narrowed to Requested Columns)
+        data_vars = _narrow_fields(COMMENT_VARS, cols)
+        ## Row Extractors (Precomputed at Initialization)
+        extractors = self._comment_extractors
+        if cols is not None:
+            extractors = [(name, fn) for name, fn in extractors if name in data_vars]
+        ## Row Generator (Avoids Materializing Response Twice)
+        ## The memo deduplicates lazy author/subreddit resolution within this pass
+        def _iter(request):
+            memo = {}
+            for r in request:
+                yield {name: fn(r, memo) for name, fn in extractors}
+        if as_records:
+            return list(_iter(request))
         ## Format into DataFrame
-        df = pd.DataFrame(response_formatted)
+        df = pd.DataFrame(_iter(request), columns=data_vars)
         if len(df) > 0:
-            df = df.sort_values("created_utc", ascending=True)
-            df = df.reset_index(drop=True)
+            df = self._optimize_dtypes(df, COMMENT_DTYPES)
+            df = self._sort_by_created_utc(df)
         return df
 
     def _getSubComments(self,
-                        comment,
+                        comments,
                         allComments):
         """
-        Helper to recursively expand comment trees from PRAW
+        Helper to iteratively expand comment trees from PRAW
 
         Args:
-            comment (comment Object): A given PRAW comment
+            comments (iterable): Top-level PRAW comments from a submission
             allComments (list): Stash of expanded comment objects
-        
+
         Returns:
-            None, appends allComments inplace recursively
+            None, appends allComments inplace iteratively
         """
-        ## Append Comment
-        allComments.append(comment)
-        ## Get Replies
-        if not hasattr(comment, "replies"):
-            replies = comment.comments()
-        else:
-            replies = comment.replies
-        ## Recurse
-        for child in replies:
-            self._getSubComments(child, allComments)
+        ## Traverse Comment Forest with an Explicit Stack
+        stack = deque(comments)
+        while stack:
+            comment = stack.pop()
+            ## Expand Comment Forest Artifacts Without Stashing Them
+            if isinstance(comment, MoreComments):
+                stack.extend(comment.comments())
+                continue
+            ## Append Comment
+            allComments.append(comment)
+            ## Push Replies
+            stack.extend(comment.replies)
 
-    def _retrieve_submission_comments_praw(self,
-                                           submission_id):
+    def _expand_comments(self,
+                         submission):
         """
-        Retrieve comments recursively from a submission using PRAW
+        Expand and parse the comment forest of a fetched PRAW submission
 
         Args:
-            submission_id (str): ID for a reddit submission
-        
+            submission (Submission Object): A fetched PRAW submission
+
         Returns:
-            comment_df (pandas DataFrame): All comments and metadata from the submission.
+            comment_df (pandas DataFrame or None): Comments and metadata from the submission.
         """
-        ## Retrieve Submission
-        sub = self._praw.submission(submission_id)
-        ## Initialize Comment List
-        comments = sub.comments
-        ## Recursively Expand Comment Forest
+        ## Expand Comment Forest
         commentsList = []
-        for comment in comments:
-            self._getSubComments(comment, commentsList)
-        ## Ignore Comment Forest Artifacts
-        commentsList = [c for c in commentsList if "MoreComments" not in str(type(c))]
+        self._getSubComments(submission.comments, commentsList)
         ## Parse
         if len(commentsList) > 0:
             comment_df = self._parse_psaw_comment_request(commentsList)
             return comment_df
+
+    def _retrieve_submission_comments_praw(self,
+                                           submission_ids):
+        """
+        Retrieve comments from submissions using PRAW. Submissions are
+        bulk-fetched (100 fullnames per API call) and their comment
+        forests expanded concurrently.
+
+        Args:
+            submission_ids (str or list of str): IDs for reddit submissions
+
+        Returns:
+            comment_df (pandas DataFrame): All comments and metadata from the submissions.
+        """
+        if isinstance(submission_ids, str):
+            submission_ids = [submission_ids]
+        ## Bulk-fetch Submissions
+        submissions = list(self._praw.info(fullnames=[f"t3_{s}" for s in submission_ids]))
+        ## Expand Comment Forests Concurrently
+        workers = self._num_workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            comment_dfs = [df for df in executor.map(self._expand_comments, submissions) if df is not None]
+        ## Concatenate
+        if len(comment_dfs) > 0:
+            comment_df = pd.concat(comment_dfs).reset_index(drop=True)
+            return comment_df
     
     def _parse_metadata(self,
                         metadata):
@@ -459,44 +1157,7 @@ class Reddit(object):
         Returns:
             metadata (dict): Subset of metadata fields and values we care about.
         """
-        metadata_columns = ["display_name",
-                            "restrict_posting",
-                            "wiki_enabled",
-                            "title",
-                            "primary_color",
-                            "active_user_count",
-                            "display_name_prefixed",
-                            "accounts_active",
-                            "public_traffic",
-                            "subscribers",
-                            "name",
-                            "quarantine",
-                            "hide_ads",
-                            "emojis_enabled",
-                            "advertiser_category",
-                            "public_description",
-                            "spoilers_enabled",
-                            "all_original_content",
-                            "key_color",
-                            "created",
-                            "submission_type",
-                            "allow_videogifs",
-                            "allow_polls",
-                            "collapse_deleted_comments",
-                            "allow_discovery",
-                            "link_flair_enabled",
-                            "subreddit_type",
-                            "suggested_comment_sort",
-                            "id",
-                            "over18",
-                            "description",
-                            "restrict_commenting",
-                            "allow_images",
-                            "lang",
-                            "whitelist_status",
-                            "url",
-                            "created_utc"]
-        metadata = dict((c, metadata[c]) for c in metadata_columns)
+        metadata = {c:metadata[c] for c in METADATA_COLUMNS if c in metadata}
         return metadata
                           
     def retrieve_subreddit_metadata(self,
@@ -514,18 +1175,17 @@ class Reddit(object):
         if not self._init_praw:
             raise ValueError("Must have initialized class with PRAW to access subreddit metadata")
         ## Load Object and Fetch Metadata
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
+        backoff = self._backoff
         for _ in range(self._max_retries):
             try:
-                sub = self._praw.subreddit(subreddit)
+                sub = self._subreddit(subreddit)
                 sub._fetch()
                 ## Parse
                 metadata = vars(sub)
                 metadata_clean = self._parse_metadata(metadata)
                 return metadata_clean
             except Exception as e:
-                sleep(backoff)
-                backoff = 2 ** backoff
+                backoff = self._sleep_before_retry(backoff, error=e)
     
     def retrieve_subreddit_submissions(self,
                                        subreddit,
@@ -553,6 +1213,53 @@ class Reddit(object):
         Returns:
             df (pandas dataframe): Submission search data
         """
+        ## Stream Per-chunk Frames and Concatenate
+        pieces = list(self.iter_subreddit_submissions(subreddit,
+                                                      start_date=start_date,
+                                                      end_date=end_date,
+                                                      limit=limit,
+                                                      cols=cols,
+                                                      chunksize=chunksize))
+        if len(pieces) == 0:
+            return
+        df_all = pd.concat(pieces, copy=False)
+        df_all = self._optimize_dtypes(df_all, SUBMISSION_DTYPES)
+        df_all = self._sort_by_created_utc(df_all)
+        if limit is not None and len(df_all) > limit:
+            df_all = df_all.iloc[:limit].copy()
+        return df_all
+
+    def iter_subreddit_submissions(self,
+                                   subreddit,
+                                   start_date=None,
+                                   end_date=None,
+                                   limit=REQUEST_LIMIT,
+                                   cols=None,
+                                   chunksize=None):
+        """
+        Retrieve submissions for a particular subreddit, yielding one
+        DataFrame per time chunk as its query completes. Useful for
+        streaming large pulls to disk without holding the full result
+        in memory. Chunks are queried concurrently, so yield order is
+        not guaranteed to be chronological; rows within a chunk are
+        sorted by created_utc.
+
+        Args:
+            subreddit (str): Canonical name of the subreddit
+            start_date (str or None): If str, expected
+                    to be parsed by pandas.to_datetime. None
+                    defaults to beginning of Reddit.
+            end_date (str or None):  If str, expected
+                    to be parse by pandas.to_datetime. None,
+                    defaults to current date
+            limit (int): Maximum number of submissions to
+                    retrieve per time chunk
+            cols (list or None): Optional Filters
+            chunksize (str): Date frequency
+
+        Yields:
+            df (pandas dataframe): Submission search data for one time chunk
+        """
         ## Get Start/End Epochs
         start_epoch = self._get_start_date(start_date)
         end_epoch = self._get_end_date(end_date)
@@ -560,49 +1267,31 @@ class Reddit(object):
         time_chunks = self._chunk_timestamps(start_epoch,
                                              end_epoch,
                                              chunksize)
-        ## Make Query Attempt
-        df_all = []
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
-        total = 0
-        for tcstart, tcstop in zip(time_chunks[:-1], time_chunks[1:]):
-            if limit is not None and total >= limit:
-                break
-            for _ in range(retries):
-                try:
-                    ## Construct Call
-                    query_params = dict(after=tcstart,
-                                        before=tcstop+1,
-                                        subreddit=subreddit,
-                                        limit=limit)
-                    if cols is not None:
-                        query_params["filter"] = cols
-                    req = self.api.search_submissions(**query_params)
-                    ## Retrieve and Parse Data
-                    df = self._parse_psaw_submission_request(req)
-                    if len(df) > 0:
-                        df = df.sort_values("created_utc", ascending=True)
-                        df = df.reset_index(drop=True)
-                        df_all.append(df)
-                        total += len(df)
-                    break
-                except Exception as e:
-                    sleep(backoff)
-                    backoff = 2 ** backoff
-        if len(df_all) == 0:
-            return
-        df_all = pd.concat(df_all).reset_index(drop=True)
-        if limit is not None and len(df_all) > limit:
-            df_all = df_all.iloc[:limit].copy()
-        return df_all
-    
+        ## Make Query Attempts (Time Chunks Are Independent -> Query Concurrently)
+        workers = self._num_workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._query_submission_chunk, tcstart, tcstop,
+                                       subreddit=subreddit, limit=limit, cols=cols)
+                       for tcstart, tcstop in zip(time_chunks[:-1], time_chunks[1:])]
+            for future in as_completed(futures):
+                records = future.result()
+                if records is None or len(records) == 0:
+                    continue
+                ## Build and Format the Chunk Frame
+                df = pd.DataFrame.from_records(records, columns=_narrow_fields(SUBMISSION_VARS, cols))
+                df = self._optimize_dtypes(df, SUBMISSION_DTYPES)
+                df = self._sort_by_created_utc(df)
+                yield df
+
     def retrieve_submission_comments(self,
                                      submission):
         """
         Retrieve comments for a particular submission
 
         Args:
-            submission (str): Canonical name of the submission
+            submission (str or list of str): Canonical name(s) of the submission(s).
+                    Lists larger than MAX_LINK_IDS_PER_REQUEST are split into
+                    multiple batched queries transparently.
 
         Returns:
             df (pandas dataframe): Comment search data
@@ -612,14 +1301,40 @@ class Reddit(object):
             submission = [submission]
         submissions_clean = []
         for s in submission:
-            if "https" in s or "reddit" in s:
-                s = s.split("comments/")[1].split("/")[0]
-            if s.startswith("t3_"):
-                s = s.replace("t3_","")
-            submissions_clean.append(s)
+            match = _SUBMISSION_ID_RE.search(s)
+            if match is None:
+                raise ValueError(f"Could not parse submission identifier: {s}")
+            submissions_clean.append(match.group(1) or match.group(2))
+        ## Query in Batches of MAX_LINK_IDS_PER_REQUEST
+        pieces = []
+        for batch in chunks(submissions_clean, MAX_LINK_IDS_PER_REQUEST):
+            df = self._retrieve_comment_batch(batch)
+            if df is not None and len(df) > 0:
+                pieces.append(df)
+        if len(pieces) == 0:
+            return pd.DataFrame(columns=COMMENT_VARS)
+        if len(pieces) == 1:
+            return pieces[0]
+        df = pd.concat(pieces, copy=False).reset_index(drop=True)
+        df = self._optimize_dtypes(df, COMMENT_DTYPES)
+        df = self._sort_by_created_utc(df)
+        return df
+
+    def _retrieve_comment_batch(self,
+                                submissions_clean):
+        """
+        Retrieve comments for one batch of cleaned submission IDs.
+
+        Args:
+            submissions_clean (list of str): Cleaned submission IDs
+                    (at most MAX_LINK_IDS_PER_REQUEST)
+
+        Returns:
+            df (pandas DataFrame or None): Comment search data (None on repeated failure)
+        """
         ## Make Query Attempt
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
+        backoff = self._backoff
+        retries = self._max_retries
         for _ in range(retries):
             try:
                 ## Construct Call
@@ -627,21 +1342,159 @@ class Reddit(object):
                 ## Retrieve and Parse data
                 df = self._parse_psaw_comment_request(req)
                 ## Fall Back to PRAW
-                if hasattr(self, "_init_praw") and self._init_praw and len(df) == 0:
-                    temp_dfs = []
-                    for s in submissions_clean:
-                        temp_dfs.append(self._retrieve_submission_comments_praw(submission_id=s))
-                    df = pd.concat(temp_dfs)
+                if self._init_praw and len(df) == 0:
+                    praw_df = self._retrieve_submission_comments_praw(submissions_clean)
+                    if praw_df is not None:
+                        df = praw_df
                 ## Sort
                 if len(df) > 0:
-                    df = df.sort_values("created_utc", ascending=True)
-                    df = df.reset_index(drop=True)
+                    df = self._sort_by_created_utc(df)
                 return df
             except Exception as e:
-                self.logger.warning(f"{e}")
-                sleep(backoff)
-                backoff = 2 ** backoff
+                backoff = self._sleep_before_retry(backoff, error=e)
+        return None
     
+    def _iter_author_records(self,
+                             author,
+                             history_type,
+                             start_date=None,
+                             end_date=None,
+                             chunksize=None,
+                             limit=None,
+                             windows=None):
+        """
+        Iterate a user's post records chunk by chunk as plain
+        dictionaries, without building any DataFrames. Lets callers
+        stream straight into a JSONL writer.
+
+        Args:
+            author (str): Username of the redditor
+            history_type (str): "comment" or "submission"
+            start_date (str or None): If str, expected
+                    to be parsed by pandas.to_datetime. None
+                    defaults to beginning of Reddit.
+            end_date (str or None):  If str, expected
+                    to be parse by pandas.to_datetime. None,
+                    defaults to current date
+            chunksize (str or None): How to break up the query time range
+            limit (int or None): Maximum number of records to yield
+            windows (list of (int, int) or None): Prebuilt (start, stop)
+                    epoch pairs. Skips date parsing and chunking, so
+                    callers that already computed the windows (e.g. for
+                    shard caching) can share them across calls.
+
+        Yields:
+            record (dict): Post fields for one comment/submission
+        """
+        ## Resolve Query Windows (Prebuilt, or Parsed and Chunked Here)
+        if windows is None:
+            start_epoch = self._get_start_date(start_date)
+            end_epoch = self._get_end_date(end_date)
+            time_chunks = self._chunk_timestamps(start_epoch,
+                                                 end_epoch,
+                                                 chunksize)
+            windows = list(zip(time_chunks[:-1], time_chunks[1:]))
+        ## Endpoint and Parser
+        if history_type == "comment":
+            endpoint = self.api.search_comments
+            parse = self._parse_psaw_comment_request
+        elif history_type == "submission":
+            endpoint = self.api.search_submissions
+            parse = self._parse_psaw_submission_request
+        else:
+            raise ValueError("history_type parameter must be either comment or submission")
+        ## Make Queries
+        yielded = 0
+        for tcstart, tcstop in windows:
+            ## Check Limit
+            if limit is not None and yielded >= limit:
+                break
+            backoff = self._backoff
+            for _ in range(self._max_retries):
+                try:
+                    ## Construct Call
+                    req = endpoint(before=tcstop+1,
+                                   after=tcstart,
+                                   author=author,
+                                   limit=limit)
+                    ## Retrieve and Parse Data
+                    for record in parse(req, as_records=True):
+                        yield record
+                        yielded += 1
+                        if limit is not None and yielded >= limit:
+                            break
+                    break
+                except Exception as e:
+                    backoff = self._sleep_before_retry(backoff, error=e)
+
+    def iter_author_comments(self,
+                             author,
+                             start_date=None,
+                             end_date=None,
+                             chunksize=None,
+                             limit=None,
+                             windows=None):
+        """
+        Iterate comment records for a Reddit user as plain dictionaries.
+
+        Args:
+            author (str): Username of the redditor
+            start_date (str or None): If str, expected
+                    to be parsed by pandas.to_datetime. None
+                    defaults to beginning of Reddit.
+            end_date (str or None):  If str, expected
+                    to be parse by pandas.to_datetime. None,
+                    defaults to current date
+            chunksize (str or None): How to break up the query time range
+            limit (int or None): Maximum number of records to yield
+            windows (list of (int, int) or None): Prebuilt (start, stop)
+                    epoch pairs, in place of the date arguments
+
+        Yields:
+            record (dict): Comment fields
+        """
+        yield from self._iter_author_records(author,
+                                             "comment",
+                                             start_date=start_date,
+                                             end_date=end_date,
+                                             chunksize=chunksize,
+                                             limit=limit,
+                                             windows=windows)
+
+    def iter_author_submissions(self,
+                                author,
+                                start_date=None,
+                                end_date=None,
+                                chunksize=None,
+                                limit=None,
+                                windows=None):
+        """
+        Iterate submission records for a Reddit user as plain dictionaries.
+
+        Args:
+            author (str): Username of the redditor
+            start_date (str or None): If str, expected
+                    to be parsed by pandas.to_datetime. None
+                    defaults to beginning of Reddit.
+            end_date (str or None):  If str, expected
+                    to be parse by pandas.to_datetime. None,
+                    defaults to current date
+            chunksize (str or None): How to break up the query time range
+            limit (int or None): Maximum number of records to yield
+            windows (list of (int, int) or None): Prebuilt (start, stop)
+                    epoch pairs, in place of the date arguments
+
+        Yields:
+            record (dict): Submission fields
+        """
+        yield from self._iter_author_records(author,
+                                             "submission",
+                                             start_date=start_date,
+                                             end_date=end_date,
+                                             chunksize=chunksize,
+                                             limit=limit,
+                                             windows=windows)
+
     def retrieve_author_comments(self,
                                  author,
                                  start_date=None,
@@ -667,45 +1520,18 @@ class Reddit(object):
         Returns:
             df (pandas dataframe): Comment search data
         """
-        ## Get Start/End Epochs
-        start_epoch = self._get_start_date(start_date)
-        end_epoch = self._get_end_date(end_date)
-        ## Chunk Queries into Time Periods
-        time_chunks = self._chunk_timestamps(start_epoch,
-                                             end_epoch,
-                                             chunksize)
-        ## Make Query Attempt
-        df_all = []
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
-        total = 0
-        for tcstart, tcstop in zip(time_chunks[:-1], time_chunks[1:]):
-            ## Check Limit
-            if limit is not None and total >= limit:
-                break
-            for _ in range(retries):
-                try:
-                    ## Construct Call
-                    query_params = {"before":tcstop+1,
-                                    "after":tcstart,
-                                    "limit":limit,
-                                    "author":author}
-                    ## Construct Call
-                    req = self.api.search_comments(**query_params)
-                    ## Retrieve and Parse Data
-                    df = self._parse_psaw_comment_request(req)
-                    if len(df) > 0:
-                        df = df.sort_values("created_utc", ascending=True)
-                        df = df.reset_index(drop=True)
-                        df_all.append(df)
-                        total += len(df)
-                    break
-                except Exception as e:
-                    sleep(backoff)
-                    backoff = 2 ** backoff
-        if len(df_all) == 0:
+        ## Stream Records Through the Shared Iterator (Incremental, Constant Memory)
+        records = list(self._iter_author_records(author,
+                                                 "comment",
+                                                 start_date=start_date,
+                                                 end_date=end_date,
+                                                 chunksize=chunksize,
+                                                 limit=limit))
+        if len(records) == 0:
             return
-        df_all = pd.concat(df_all).reset_index(drop=True)
+        df_all = pd.DataFrame(records, columns=COMMENT_VARS)
+        df_all = self._optimize_dtypes(df_all, COMMENT_DTYPES)
+        df_all = self._sort_by_created_utc(df_all)
         if limit is not None and len(df_all) > limit:
             df_all = df_all.iloc[:limit].copy()
         return df_all
@@ -735,45 +1561,18 @@ class Reddit(object):
         Returns:
             df (pandas dataframe): Comment search data
         """
-        ## Get Start/End Epochs
-        start_epoch = self._get_start_date(start_date)
-        end_epoch = self._get_end_date(end_date)
-        ## Chunk Queries into Time Periods
-        time_chunks = self._chunk_timestamps(start_epoch,
-                                             end_epoch,
-                                             chunksize)
-        ## Make Queries
-        df_all = []
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
-        total = 0
-        for tcstart, tcstop in zip(time_chunks[:-1], time_chunks[1:]):
-            ## Check Limit
-            if limit is not None and total >= limit:
-                break
-            for _ in range(retries):
-                try:
-                    ## Construct Call
-                    query_params = {"before":tcstop+1,
-                                    "after":tcstart,
-                                    "limit":limit,
-                                    "author":author}
-                    ## Construct Call
-                    req = self.api.search_submissions(**query_params)
-                    ## Retrieve and Parse Data
-                    df = self._parse_psaw_submission_request(req)
-                    if len(df) > 0:
-                        df = df.sort_values("created_utc", ascending=True)
-                        df = df.reset_index(drop=True)
-                        df_all.append(df)
-                        total += len(df)
-                    break
-                except Exception as e:
-                    sleep(backoff)
-                    backoff = 2 ** backoff
-        if len(df_all) == 0:
+        ## Stream Records Through the Shared Iterator (Incremental, Constant Memory)
+        records = list(self._iter_author_records(author,
+                                                 "submission",
+                                                 start_date=start_date,
+                                                 end_date=end_date,
+                                                 chunksize=chunksize,
+                                                 limit=limit))
+        if len(records) == 0:
             return
-        df_all = pd.concat(df_all).reset_index(drop=True)
+        df_all = pd.DataFrame(records, columns=SUBMISSION_VARS)
+        df_all = self._optimize_dtypes(df_all, SUBMISSION_DTYPES)
+        df_all = self._sort_by_created_utc(df_all)
         if limit is not None and len(df_all) > limit:
             df_all = df_all.iloc[:limit].copy()
         return df_all
@@ -816,8 +1615,8 @@ class Reddit(object):
         if subreddit is not None:
             query_params["subreddit"] = subreddit
         ## Make Query Attempt
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
+        backoff = self._backoff
+        retries = self._max_retries
         for _ in range(retries):
             try:
                 ## Construct Call
@@ -825,12 +1624,10 @@ class Reddit(object):
                 ## Retrieve and Parse Data
                 df = self._parse_psaw_submission_request(req)
                 if len(df) > 0:
-                    df = df.sort_values("created_utc", ascending=True)
-                    df = df.reset_index(drop=True)
+                    df = self._sort_by_created_utc(df)
                 return df
             except Exception as e:
-                sleep(backoff)
-                backoff = 2 ** backoff
+                backoff = self._sleep_before_retry(backoff, error=e)
     
     def search_for_comments(self,
                             query=None,
@@ -870,8 +1667,8 @@ class Reddit(object):
         if query is not None:
             query_params["q"] = query
         ## Make Query Attempt
-        backoff = self._backoff if hasattr(self, "_backoff") else 2
-        retries = self._max_retries if hasattr(self, "_max_retries") else 3
+        backoff = self._backoff
+        retries = self._max_retries
         for _ in range(retries):
             try:
                 ## Construct Call
@@ -879,13 +1676,46 @@ class Reddit(object):
                 ## Retrieve and Parse Data
                 df = self._parse_psaw_comment_request(req)
                 if len(df) > 0:
-                    df = df.sort_values("created_utc", ascending=True)
-                    df = df.reset_index(drop=True)
+                    df = self._sort_by_created_utc(df)
                 return df
             except Exception as e:
-                sleep(backoff)
-                backoff = 2 ** backoff
+                backoff = self._sleep_before_retry(backoff, error=e)
     
+    def _fetch_window_counts(self,
+                             endpoint,
+                             start,
+                             stop):
+        """
+        Count submissions per subreddit within a single time window.
+
+        Args:
+            endpoint (str): Pushshift search endpoint
+            start (int): Start epoch for the window
+            stop (int): Stop epoch for the window
+
+        Returns:
+            sub_count (Counter): Subreddit -> submission count in window
+        """
+        ## Cycle Through Attempts
+        backoff = self._backoff
+        retries = self._max_retries
+        for _ in range(retries):
+            try:
+                _RATE_LIMITER.wait()
+                resp = self._http.get(endpoint,
+                                      params={"after":start, "before":stop, "filter":"subreddit"})
+                _RATE_LIMITER.update(resp.headers)
+                ## Parse Request
+                if resp.status_code == 200:
+                    data = resp.json()["data"]
+                    sleep(self.api.backoff)
+                    return Counter(i["subreddit"] for i in data)
+                else: ## Sleep with backoff (honoring Retry-After)
+                    backoff = self._sleep_before_retry(backoff, response=resp)
+            except Exception as e:
+                backoff = self._sleep_before_retry(backoff, error=e)
+        return Counter()
+
     def identify_active_subreddits(self,
                                    start_date=None,
                                    end_date=None,
@@ -913,37 +1743,59 @@ class Reddit(object):
         time_chunks = self._chunk_timestamps(start_epoch,
                                              end_epoch,
                                              chunksize)
-        ## Query Subreddits
+        ## Query Subreddits (Windows are Independent -> Fetch Concurrently)
         endpoint = "https://api.pushshift.io/reddit/search/submission/"
         subreddit_count = Counter()
-        for start, stop in tqdm(zip(time_chunks[:-1], time_chunks[1:]), total = len(time_chunks)-1, file=sys.stdout):
-            ## Make Get Request
-            req = f"{endpoint}?after={start}&before={stop}&filter=subreddit"
-            ## Cycle Through Attempts
-            backoff = self._backoff if hasattr(self, "_backoff") else 2
-            retries = self._max_retries if hasattr(self, "_max_retries") else 3
-            for _ in range(retries):
-                try:
-                    resp = requests.get(req)
-                    ## Parse Request
-                    if resp.status_code == 200:
-                        data = resp.json()["data"]
-                        sub_count = Counter([i["subreddit"] for i in data])
-                        subreddit_count = subreddit_count + sub_count
-                        sleep(self.api.backoff)
-                        break
-                    else: ## Sleep with exponential backoff
-                        sleep(backoff)
-                        backoff = 2 ** backoff
-                except Exception as e:
-                    sleep(backoff)
-                    backoff = 2 ** backoff
+        window_pairs = list(zip(time_chunks[:-1], time_chunks[1:]))
+        with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+            futures = [executor.submit(self._fetch_window_counts, endpoint, start, stop)
+                       for start, stop in window_pairs]
+            for future in tqdm(as_completed(futures), total=len(futures), file=sys.stdout):
+                subreddit_count.update(future.result())
         ## Format
         subreddit_count = pd.Series(subreddit_count).sort_values(ascending=False)
-        ## Drop User-Subreddits
-        subreddit_count = subreddit_count.loc[subreddit_count.index.map(lambda i: not i.startswith("u_"))]
+        ## Drop User-Subreddits (Vectorized String Filter)
+        subreddit_count = subreddit_count.loc[~subreddit_count.index.str.startswith("u_")]
         return subreddit_count
 
+    def _query_author_chunk(self,
+                            tcstart,
+                            tcstop,
+                            endpoint,
+                            subreddit):
+        """
+        Count post authors in a single time chunk of a subreddit, with
+        retries. Deleted/removed authors and obvious bots are dropped.
+
+        Args:
+            tcstart (int): Start of the chunk (epoch)
+            tcstop (int): End of the chunk (epoch)
+            endpoint (str): "search_comments" or "search_submissions".
+                    Resolved against self.api inside this worker so
+                    each pool thread pages through its own client.
+            subreddit (str): Canonical name of the subreddit
+
+        Returns:
+            ac (Counter or None): Author -> post count (None on repeated failure)
+        """
+        backoff = self._backoff
+        retries = self._max_retries
+        search = getattr(self.api, endpoint)
+        for _ in range(retries):
+            try:
+                req = search(subreddit=subreddit,
+                               after=tcstart,
+                               before=tcstop,
+                               filter="author")
+                ## Filter and Count in Vectorized pandas Ops
+                resp = pd.Series([a.author for a in req], dtype="string")
+                if len(resp) > 0:
+                    resp = resp[~resp.isin({"[deleted]", "[removed]"}) & ~resp.str.lower().str.endswith("bot")]
+                return Counter(resp.value_counts().to_dict())
+            except Exception as e:
+                backoff = self._sleep_before_retry(backoff, error=e)
+        return None
+
     def retrieve_subreddit_user_history(self,
                                         subreddit,
                                         start_date=None,
@@ -970,36 +1822,27 @@ class Reddit(object):
         ## Get Start/End Epochs
         start_epoch = self._get_start_date(start_date)
         end_epoch = self._get_end_date(end_date)
-        ## Chunk Queries into Time Periods
+        ## Chunk Queries into Time Periods. No doc-count preflight is needed
+        ## here: PSAW pages each chunk exhaustively, so uneven activity only
+        ## affects per-chunk latency, never coverage.
         time_chunks = self._chunk_timestamps(start_epoch,
                                              end_epoch,
                                              chunksize)
-        ## Endpoint
+        ## Endpoint (Passed by Name: Workers Bind Their Own Thread-local Client)
         if history_type == "comment":
-            endpoint = self.api.search_comments
+            endpoint = "search_comments"
         elif history_type == "submission":
-            endpoint = self.api.search_submissions
+            endpoint = "search_submissions"
         else:
             raise ValueError("history_type parameter must be either comment or submission")
-        ## Query Authors
+        ## Query Authors (Chunks are Independent -> Fetch Concurrently)
+        chunk_counts = self._query_time_chunks(self._query_author_chunk,
+                                               time_chunks,
+                                               endpoint=endpoint,
+                                               subreddit=subreddit)
         authors = Counter()
-        for start, stop in tqdm(zip(time_chunks[:-1], time_chunks[1:]), total=len(time_chunks)-1, file=sys.stdout):
-            backoff = self._backoff if hasattr(self, "_backoff") else 2
-            retries = self._max_retries if hasattr(self, "_max_retries") else 3
-            for _ in range(retries):
-                try:
-                    req = endpoint(subreddit=subreddit,
-                                   after=start,
-                                   before=stop,
-                                   filter="author")
-                    resp = [a.author for a in req]
-                    resp = list(filter(lambda i: i != "[deleted]" and i != "[removed]" and not i.lower().endswith("bot"), resp))
-                    ac = Counter(resp)
-                    authors += ac
-                    break
-                except Exception as e:
-                    sleep(backoff)
-                    backoff = 2 ** backoff
+        for ac in chunk_counts:
+            authors.update(ac)
         ## Format
         authors = pd.Series(authors).sort_values(ascending=False)
         return authors
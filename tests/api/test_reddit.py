@@ -6,6 +6,8 @@
 ## Standard
 import os
 import pytz
+import threading
+from time import time
 from datetime import timedelta
 from datetime import datetime
 
@@ -15,6 +17,7 @@ import pandas as pd
 
 ## Local
 from retriever import Reddit
+from retriever.api import reddit as reddit_module
 
 #######################
 ### Fixtures
@@ -259,3 +262,172 @@ def test_convert_utc_epoch_to_datetime(reddit_psaw):
     assert pacfic_converted.day == 22
     assert pacfic_converted.hour == 6
     assert pacfic_converted.minute == 45
+
+def test_rate_limiter_allows_under_limit():
+    """
+
+    """
+    ## Initialize With Room to Spare
+    limiter = reddit_module._RateLimiter(max_per_minute=5)
+    ## Issue Requests Under the Limit
+    start = time()
+    for _ in range(5):
+        limiter.wait()
+    ## Tests (No Blocking, One Timestamp per Request)
+    assert time() - start < 1
+    assert len(limiter._timestamps) == 5
+
+def test_rate_limiter_sliding_window():
+    """
+
+    """
+    ## Initialize at Capacity With a Stale Timestamp
+    limiter = reddit_module._RateLimiter(max_per_minute=1)
+    limiter._timestamps.append(time() - 61)
+    ## The Stale Entry Should be Evicted Without Blocking
+    start = time()
+    limiter.wait()
+    ## Tests
+    assert time() - start < 1
+    assert len(limiter._timestamps) == 1
+    assert time() - limiter._timestamps[0] < 1
+
+def test_rate_limiter_header_feedback():
+    """
+
+    """
+    ## Retry-After Pauses All Callers
+    limiter = reddit_module._RateLimiter(max_per_minute=5)
+    limiter.update({"Retry-After":"0.2"})
+    start = time()
+    limiter.wait()
+    assert time() - start >= 0.15
+    ## Exhausted Remaining Quota Pauses Until the Reset
+    limiter = reddit_module._RateLimiter(max_per_minute=5)
+    limiter.update({"x-ratelimit-remaining":"0", "x-ratelimit-reset":"0.2"})
+    start = time()
+    limiter.wait()
+    assert time() - start >= 0.15
+    ## Malformed Headers and Missing Headers are Ignored
+    limiter = reddit_module._RateLimiter(max_per_minute=5)
+    limiter.update({"Retry-After":"soon"})
+    limiter.update(None)
+    start = time()
+    limiter.wait()
+    assert time() - start < 1
+
+def test_rate_limiter_thread_safety():
+    """
+
+    """
+    ## One Timestamp per Call, Even Under Concurrent Access
+    limiter = reddit_module._RateLimiter(max_per_minute=10000)
+    def hammer():
+        for _ in range(50):
+            limiter.wait()
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ## Test
+    assert len(limiter._timestamps) == 8 * 50
+
+def test_next_backoff():
+    """
+
+    """
+    ## Exponential Growth With Bounded Jitter
+    for _ in range(25):
+        backoff = reddit_module._next_backoff(2, cap=60, base=2)
+        assert 4 <= backoff <= 5
+    ## Cap Bounds the Pre-jitter Delay
+    for _ in range(25):
+        backoff = reddit_module._next_backoff(100, cap=60, base=2)
+        assert 60 <= backoff <= 75
+
+def test_chunk_timestamps(reddit_psaw):
+    """
+
+    """
+    ## No Chunksize -> Single Window
+    assert reddit_psaw._chunk_timestamps(0, 100, None) == [0, 100]
+    ## Even Split
+    day = 60 * 60 * 24
+    chunks = reddit_psaw._chunk_timestamps(0, 4 * day, "2d")
+    assert chunks == [0, 2 * day, 4 * day]
+    ## Ragged Tail is Clipped to the End Epoch
+    chunks = reddit_psaw._chunk_timestamps(0, 5 * day, "2d")
+    assert chunks == [0, 2 * day, 4 * day, 5 * day]
+    ## Boundaries are Monotonic
+    assert all(a < b for a, b in zip(chunks[:-1], chunks[1:]))
+
+def test_submission_id_re():
+    """
+
+    """
+    ## Full Permalink
+    match = reddit_module._SUBMISSION_ID_RE.search("https://www.reddit.com/r/modeltrains/comments/6v7yvh/layout_update/")
+    assert (match.group(1) or match.group(2)) == "6v7yvh"
+    ## Fullname Prefix
+    match = reddit_module._SUBMISSION_ID_RE.search("t3_6v7yvh")
+    assert (match.group(1) or match.group(2)) == "6v7yvh"
+    ## Bare ID
+    match = reddit_module._SUBMISSION_ID_RE.search("6v7yvh")
+    assert (match.group(1) or match.group(2)) == "6v7yvh"
+    ## Garbage Does Not Match
+    assert reddit_module._SUBMISSION_ID_RE.search("!!!") is None
+
+@pytest.mark.skipif(reddit_module.requests_cache is None, reason="requests-cache not installed")
+def test_invalidate_cache(reddit_psaw):
+    """
+
+    """
+    from requests_cache.models import CachedRequest, CachedResponse
+    ## Seed the Installed Cache With Two Fabricated Responses
+    cache = reddit_module.requests_cache.get_cache()
+    cache.clear()
+    for url in ["https://api.pushshift.io/reddit/search/comment/?size=0&aggs=subreddit",
+                "https://oauth.reddit.com/r/modeltrains/about/"]:
+        request = CachedRequest(method="GET", url=url)
+        cache.save_response(CachedResponse(url=url, status_code=200, request=request))
+    assert len(list(cache.urls())) == 2
+    ## Filtered Invalidation Only Removes Matching URLs
+    reddit_psaw.invalidate_cache(url_filter="modeltrains")
+    remaining = list(cache.urls())
+    assert len(remaining) == 1
+    assert "pushshift" in remaining[0]
+    ## Unmatched Filters are a No-op
+    reddit_psaw.invalidate_cache(url_filter="doesnotexist")
+    assert len(list(cache.urls())) == 1
+    ## No Filter Clears Everything
+    reddit_psaw.invalidate_cache()
+    assert len(list(cache.urls())) == 0
+
+def test_cacheable_url():
+    """
+
+    """
+    ## Count Preflights and Metadata Lookups are Cacheable
+    assert reddit_module._cacheable_url("https://api.pushshift.io/reddit/search/comment/?size=0&aggs=subreddit")
+    assert reddit_module._cacheable_url("https://oauth.reddit.com/r/modeltrains/about/")
+    ## Live Search Traffic is Not
+    assert not reddit_module._cacheable_url("https://api.pushshift.io/reddit/search/comment/?q=test&subreddit=modeltrains")
+    assert not reddit_module._cacheable_url("https://api.pushshift.io/reddit/search/submission/?after=0&before=1")
+    ## Missing URLs are Not
+    assert not reddit_module._cacheable_url(None)
+    assert not reddit_module._cacheable_url("")
+
+@pytest.mark.skipif(reddit_module.requests_cache is None, reason="requests-cache not installed")
+def test_response_cache_filter_installed(reddit_psaw):
+    """
+
+    """
+    ## The Installed Session Scopes Caching Through the URL Predicate
+    filter_fn = reddit_psaw._http.settings.filter_fn
+    assert filter_fn is not None
+    from requests_cache.models import CachedRequest, CachedResponse
+    def fake(url):
+        return CachedResponse(url=url, status_code=200, request=CachedRequest(method="GET", url=url))
+    assert filter_fn(fake("https://api.pushshift.io/reddit/search/comment/?size=0&aggs=subreddit"))
+    assert not filter_fn(fake("https://api.pushshift.io/reddit/search/comment/?q=test"))
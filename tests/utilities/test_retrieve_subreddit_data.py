@@ -0,0 +1,88 @@
+
+#####################
+### Imports
+#####################
+
+## Standard Library
+import os
+import gzip
+import json
+import importlib.util
+
+## External
+import pytest
+import pandas as pd
+
+#####################
+### Module Loading
+#####################
+
+## The Utilities are Standalone Scripts (Not Part of the Package), so
+## Load the Module Under Test Directly From its File
+_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "utilities", "retrieve_subreddit_data.py")
+_spec = importlib.util.spec_from_file_location("retrieve_subreddit_data", _SCRIPT_PATH)
+rsd = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rsd)
+
+#####################
+### Tests
+#####################
+
+def test_get_date_range():
+    """
+
+    """
+    ## Aligned Range
+    date_range = rsd.get_date_range("2020-01-01", "2020-01-15", "7D")
+    assert date_range == ("2020-01-01", "2020-01-08", "2020-01-15")
+    ## Ragged End Date is Appended
+    date_range = rsd.get_date_range("2020-01-01", "2020-01-10", "7D")
+    assert date_range == ("2020-01-01", "2020-01-08", "2020-01-10")
+    ## Results are Memoized per Argument Set
+    assert rsd.get_date_range("2020-01-01", "2020-01-15", "7D") is rsd.get_date_range("2020-01-01", "2020-01-15", "7D")
+
+def test_write_jsonl_gz_roundtrip(tmp_path):
+    """
+
+    """
+    ## Write
+    df = pd.DataFrame([{"id":"a", "num_comments":1},
+                       {"id":"b", "num_comments":2}])
+    path = str(tmp_path / "out.json.gz")
+    rsd.write_jsonl_gz(df, path)
+    ## Read Back
+    with gzip.open(path, "rt") as f:
+        loaded = [json.loads(line) for line in f]
+    ## Test
+    assert loaded == df.to_dict(orient="records")
+
+def test_load_submission_link_ids(tmp_path):
+    """
+
+    """
+    ## Build a Submissions Archive
+    sub_file = str(tmp_path / "subs.json.gz")
+    with gzip.open(sub_file, "wt") as f:
+        for i in range(5):
+            f.write(json.dumps({"id":f"s{i}", "num_comments":i, "selftext":"x" * 100}) + "\n")
+    ## Comment Threshold Filter (Strictly Greater Than)
+    link_ids = rsd.load_submission_link_ids(sub_file, min_comments=2)
+    assert link_ids == ["s3", "s4"]
+    ## No Threshold Keeps Everything With at Least One Comment
+    link_ids = rsd.load_submission_link_ids(sub_file, min_comments=0)
+    assert link_ids == ["s1", "s2", "s3", "s4"]
+    ## Sampling is a Deterministic Subset
+    sampled = rsd.load_submission_link_ids(sub_file, min_comments=0, sample_percent=0.6, random_state=42)
+    assert set(sampled) <= {"s1", "s2", "s3", "s4"}
+    assert sampled == rsd.load_submission_link_ids(sub_file, min_comments=0, sample_percent=0.6, random_state=42)
+
+def test_load_submission_link_ids_empty(tmp_path):
+    """
+
+    """
+    ## Empty Archive
+    sub_file = str(tmp_path / "empty.json.gz")
+    with gzip.open(sub_file, "wt") as f:
+        pass
+    ## Test
+    assert rsd.load_submission_link_ids(sub_file, min_comments=0) == []
@@ -0,0 +1,190 @@
+
+#####################
+### Imports
+#####################
+
+## Standard Library
+import os
+import gzip
+import json
+import importlib.util
+
+## External
+import pytest
+import pandas as pd
+
+#####################
+### Module Loading
+#####################
+
+## The Utilities are Standalone Scripts (Not Part of the Package), so
+## Load the Module Under Test Directly From its File
+_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "utilities", "retrieve_user_data.py")
+_spec = importlib.util.spec_from_file_location("retrieve_user_data", _SCRIPT_PATH)
+rud = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rud)
+
+#####################
+### Helpers
+#####################
+
+class StubReddit(object):
+
+    """
+    Offline stand-in for the wrapper: fixed two-window chunking and
+    canned per-window records, with a counter on fetches so tests can
+    assert the shard cache short-circuits them.
+    """
+
+    def __init__(self,
+                 window_records=None,
+                 count=0):
+        self._window_records = window_records or {}
+        self._count_value = count
+        self.fetch_calls = 0
+
+    def _get_start_date(self,
+                        start_date):
+        return int(pd.to_datetime(start_date).timestamp())
+
+    def _get_end_date(self,
+                      end_date):
+        return int(pd.to_datetime(end_date).timestamp())
+
+    def _chunk_timestamps(self,
+                          start_epoch,
+                          end_epoch,
+                          chunksize):
+        midpoint = (start_epoch + end_epoch) // 2
+        return [start_epoch, midpoint, end_epoch]
+
+    def _count(self,
+               endpoint,
+               **params):
+        return self._count_value
+
+    def iter_author_comments(self,
+                             author,
+                             windows=None,
+                             **kwargs):
+        self.fetch_calls += 1
+        yield from self._window_records.get(windows[0], [])
+
+#####################
+### Tests
+#####################
+
+def test_write_records_jsonl_gz_roundtrip(tmp_path):
+    """
+
+    """
+    ## Write
+    records = [{"id":"a", "score":1, "body":None},
+               {"id":"b", "score":2, "body":"text"}]
+    path = str(tmp_path / "out.json.gz")
+    rud.write_records(records, path)
+    ## Read Back
+    with gzip.open(path, "rt") as f:
+        loaded = [json.loads(line) for line in f]
+    ## Test
+    assert loaded == records
+
+@pytest.mark.skipif(rud.zstandard is None, reason="zstandard not installed")
+def test_write_records_jsonl_zst_roundtrip(tmp_path):
+    """
+
+    """
+    ## Write
+    records = [{"id":"a", "score":1},
+               {"id":"b", "score":2}]
+    path = str(tmp_path / "out.jsonl.zst")
+    rud.write_records(records, path, output_format="jsonl.zst")
+    ## Read Back
+    with open(path, "rb") as f:
+        raw = rud.zstandard.ZstdDecompressor().stream_reader(f).read()
+    loaded = [json.loads(line) for line in raw.decode("utf-8").splitlines()]
+    ## Test
+    assert loaded == records
+
+def test_write_records_parquet_roundtrip(tmp_path):
+    """
+
+    """
+    pyarrow = pytest.importorskip("pyarrow")
+    ## Write
+    records = [{"id":"a", "score":1},
+               {"id":"b", "score":2}]
+    path = str(tmp_path / "out.parquet")
+    rud.write_records(records, path, output_format="parquet")
+    ## Read Back
+    loaded = pd.read_parquet(path).to_dict(orient="records")
+    ## Test
+    assert loaded == records
+
+def test_resolve_query_freq():
+    """
+
+    """
+    ## Explicit Frequencies Pass Through Untouched
+    reddit = StubReddit()
+    assert rud.resolve_query_freq(reddit, "a", "comments", "2020-01-01", "2021-01-01", "1Y") == "1Y"
+    ## Heavy Users Get Small Windows
+    reddit = StubReddit(count=100000)
+    freq = rud.resolve_query_freq(reddit, "a", "comments", "2016-01-01", "2021-01-01", "auto")
+    assert freq.endswith("D")
+    assert int(freq[:-1]) < rud.MAX_WINDOW_DAYS
+    assert int(freq[:-1]) >= rud.MIN_WINDOW_DAYS
+    ## Light Users Get the Widest Windows
+    reddit = StubReddit(count=10)
+    assert rud.resolve_query_freq(reddit, "a", "comments", "2016-01-01", "2021-01-01", "auto") == f"{rud.MAX_WINDOW_DAYS}D"
+    ## Empty Users Too (No Division by Zero)
+    reddit = StubReddit(count=0)
+    assert rud.resolve_query_freq(reddit, "a", "comments", "2016-01-01", "2021-01-01", "auto") == f"{rud.MAX_WINDOW_DAYS}D"
+
+def test_pull_author_history_writes_and_caches(tmp_path):
+    """
+
+    """
+    ## Two Windows of Canned Records
+    reddit = StubReddit()
+    start_epoch = reddit._get_start_date("2020-01-01")
+    end_epoch = reddit._get_end_date("2020-12-31")
+    midpoint = (start_epoch + end_epoch) // 2
+    reddit._window_records = {(start_epoch, midpoint):[{"id":"c1", "created_utc":start_epoch + 1}],
+                              (midpoint, end_epoch):[{"id":"c2", "created_utc":midpoint + 1},
+                                                     {"id":"c3", "created_utc":midpoint + 2}]}
+    cache_dir = str(tmp_path / ".cache")
+    rud.create_dir(cache_dir)
+    outfile = str(tmp_path / "tester_comments.json.gz")
+    ## First Pull Fetches Both Windows
+    n = rud.pull_author_history(reddit, "tester", "comments", outfile, "2020-01-01", "2020-12-31", "180D", cache_dir)
+    assert n == 3
+    assert reddit.fetch_calls == 2
+    assert os.path.exists(outfile)
+    assert len(os.listdir(cache_dir)) == 2
+    ## Output Holds All Records in Window Order
+    with gzip.open(outfile, "rt") as f:
+        loaded = [json.loads(line) for line in f]
+    assert [r["id"] for r in loaded] == ["c1", "c2", "c3"]
+    ## Second Pull is Served Entirely From the Shard Cache
+    reddit.fetch_calls = 0
+    outfile_resume = str(tmp_path / "tester_comments_resume.json.gz")
+    n = rud.pull_author_history(reddit, "tester", "comments", outfile_resume, "2020-01-01", "2020-12-31", "180D", cache_dir)
+    assert n == 3
+    assert reddit.fetch_calls == 0
+    with gzip.open(outfile_resume, "rt") as f:
+        assert [json.loads(line)["id"] for line in f] == ["c1", "c2", "c3"]
+
+def test_pull_author_history_empty_removes_outfile(tmp_path):
+    """
+
+    """
+    ## No Records in Either Window
+    reddit = StubReddit()
+    cache_dir = str(tmp_path / ".cache")
+    rud.create_dir(cache_dir)
+    outfile = str(tmp_path / "nobody_comments.json.gz")
+    n = rud.pull_author_history(reddit, "nobody", "comments", outfile, "2020-01-01", "2020-12-31", "180D", cache_dir)
+    ## Tests
+    assert n == 0
+    assert not os.path.exists(outfile)
@@ -5,21 +5,25 @@
 ## Standard Libary
 import sys
 import os
-import sys
-import jsonlines
 import json
 import gzip
 import argparse
-from time import sleep
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
 ## External
-import pandas as pd
 from tqdm import tqdm
 
-## Local
-from retriever import Reddit
-from retriever.util.helpers import chunks
+## External (Optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+## Local (Deferred: pandas and the retriever import chain dominate CLI
+## startup, so functions that need them import at call time and --help
+## stays fast)
 
 ####################
 ### Globals
@@ -29,6 +33,9 @@ from retriever.util.helpers import chunks
 logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger()
 
+## Concurrent Downloads (Bounded to Respect Pushshift Quotas)
+MAX_WORKERS = 8
+
 ## Filter Columns (To Reduce Request Load)
 SUBMISSION_COLS = [
     "author",
@@ -72,8 +79,8 @@ def parse_arguments():
                         help="Filtering criteria for querying comments based on submissions")
     parser.add_argument("--use-praw", action="store_true", default=False,
                         help="Retrieve Official API data objects (at expense of query time) instead of Pushshift.io data")
-    parser.add_argument("--chunksize", type=int, default=50,
-                        help="Number of submissions to query comments from simultaneously")
+    parser.add_argument("--chunksize", type=int, default=500,
+                        help="Number of submissions per batched comment query; chunks are fetched concurrently")
     parser.add_argument("--sample-percent", type=float, default=1, help="Submission sample percent (0, 1]")
     parser.add_argument("--random-state", type=int, default=42, help="Sample seed for any submission sampling")
     parser.add_argument("--debug", action="store_true", help="Run script in debug mode.")
@@ -87,33 +94,189 @@ def parse_arguments():
 
 def create_dir(directory):
     """Create directory if it does not exist"""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    os.makedirs(directory, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=8)
 def get_date_range(start_date,
                    end_date,
                    query_freq):
     """
 
     """
-    ## Query Date Range
-    DATE_RANGE = list(pd.date_range(start_date, end_date, freq=query_freq))
+    import pandas as pd
+    ## Query Date Range (Vectorized Formatting, Memoized per Argument Set)
+    DATE_RANGE = pd.date_range(start_date, end_date, freq=query_freq)
     if len(DATE_RANGE) == 0:
         LOGGER.error(f"Start, End Date, and Query frequency are not compatible. Or provided end date ({str(end_date)}) is before start date ({str(start_date)})")
         exit(1)
-    if pd.to_datetime(start_date) < DATE_RANGE[0]:
-        DATE_RANGE = [pd.to_datetime(start_date)] + DATE_RANGE
-    if pd.to_datetime(end_date) > DATE_RANGE[-1]:
-        DATE_RANGE = DATE_RANGE + [pd.to_datetime(end_date)]
-    DATE_RANGE = [d.date().isoformat() for d in DATE_RANGE]
-    return DATE_RANGE
+    DATE_RANGE = DATE_RANGE.strftime("%Y-%m-%d").tolist()
+    start_iso = pd.to_datetime(start_date).date().isoformat()
+    end_iso = pd.to_datetime(end_date).date().isoformat()
+    if start_iso < DATE_RANGE[0]:
+        DATE_RANGE = [start_iso] + DATE_RANGE
+    if end_iso > DATE_RANGE[-1]:
+        DATE_RANGE.append(end_iso)
+    return tuple(DATE_RANGE)
+
+
+def _json_default(obj):
+    """Serialize values orjson does not handle natively (pandas NA/Timestamps)"""
+    import pandas as pd
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    return str(obj)
+
+
+def write_jsonl_gz(df,
+                   path):
+    """
+    Write a DataFrame to gzipped JSONL. Uses orjson when available
+    (much faster than the pandas json writer) and a low gzip
+    compression level to favor write throughput.
+
+    Args:
+        df (pandas DataFrame): Records to write
+        path (str): Output filepath (.json.gz)
+
+    Returns:
+        None
+    """
+    if orjson is None:
+        df.to_json(path, orient="records", lines=True, compression={"method":"gzip", "compresslevel":1})
+        return
+    with gzip.open(path, "wb", compresslevel=1) as f:
+        for rec in df.to_dict(orient="records"):
+            f.write(orjson.dumps(rec, default=_json_default))
+            f.write(b"\n")
+
+
+def load_submission_link_ids(sub_file,
+                             min_comments,
+                             sample_percent=1,
+                             random_state=42):
+    """
+    Stream a submissions archive and return the IDs eligible for a
+    comment pull. Only id and num_comments are parsed out of each
+    record, so large text columns (selftext, title) never enter memory.
+
+    Args:
+        sub_file (str): Path to a submissions .json.gz archive
+        min_comments (int): Minimum comment count to qualify
+        sample_percent (float): Submission sample percent (0, 1]
+        random_state (int): Sample seed for any submission sampling
+
+    Returns:
+        link_ids (list of str): Qualifying submission IDs
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    ids = []
+    num_comments = []
+    with gzip.open(sub_file, "rt") as f:
+        for line in f:
+            rec = loads(line)
+            ids.append(rec.get("id"))
+            num_comments.append(rec.get("num_comments") or 0)
+    if len(ids) == 0:
+        return []
+    if sample_percent < 1:
+        import pandas as pd
+        sampled = pd.DataFrame({"id":ids, "num_comments":num_comments}).sample(frac=sample_percent,
+                                                                               random_state=random_state,
+                                                                               replace=False)
+        ids = sampled["id"].tolist()
+        num_comments = sampled["num_comments"].tolist()
+    return [i for i, n in zip(ids, num_comments) if n > min_comments]
+
+
+def pull_submission_window(reddit,
+                           subreddit,
+                           dstart,
+                           dstop,
+                           submission_file,
+                           cols):
+    """
+    Retrieve one date window of subreddit submissions and write it to
+    its archive file.
+
+    Args:
+        reddit (Reddit): Initialized API wrapper
+        subreddit (str): Name of the subreddit
+        dstart (str): Window start date (ISO format)
+        dstop (str): Window stop date (ISO format)
+        submission_file (str): Output path for the window archive
+        cols (list or None): Optional metadata column filter
+
+    Returns:
+        n (int): Number of submissions written (0 if the window was empty)
+    """
+    subreddit_submissions = reddit.retrieve_subreddit_submissions(subreddit,
+                                                                  start_date=dstart,
+                                                                  end_date=dstop,
+                                                                  limit=None,
+                                                                  cols=cols)
+    if subreddit_submissions is None or subreddit_submissions.empty:
+        return 0
+    write_jsonl_gz(subreddit_submissions, submission_file)
+    return len(subreddit_submissions)
+
+
+def append_jsonl_gz(df,
+                    fileobj):
+    """
+    Append DataFrame records to an already-open gzip JSONL archive.
+
+    Args:
+        df (pandas DataFrame): Records to append
+        fileobj (file): Open binary gzip file handle
+
+    Returns:
+        None
+    """
+    if orjson is None:
+        fileobj.write(df.to_json(orient="records", lines=True).encode("utf-8"))
+        fileobj.write(b"\n")
+        return
+    for rec in df.to_dict(orient="records"):
+        fileobj.write(orjson.dumps(rec, default=_json_default))
+        fileobj.write(b"\n")
+
+
+def pull_comment_chunk(reddit,
+                       link_id_chunk):
+    """
+    Retrieve comments for one chunk of submissions, grouped by
+    submission. Writing is left to the caller so all chunks of a date
+    window can share one archive file.
+
+    Args:
+        reddit (Reddit): Initialized API wrapper
+        link_id_chunk (list of str): Submission IDs to query together
+
+    Returns:
+        groups (dict): link_id -> comment DataFrame (only non-empty groups)
+    """
+    link_df = reddit.retrieve_submission_comments(link_id_chunk)
+    if link_df is None or link_df.empty:
+        return {}
+    ## Group Once Instead of Scanning the Frame per link_id
+    groups = dict(iter(link_df.groupby("link_id", sort=False)))
+    out = {}
+    for link_id in link_id_chunk:
+        link_id_df = groups.get(f"t3_{link_id}")
+        if link_id_df is not None and not link_id_df.empty:
+            out[link_id] = link_id_df
+    return out
 
 
 def main():
     """Main program"""
     ## Parse Arguments
     args = parse_arguments()
+    ## Heavy Imports, Deferred Until Arguments Are Valid
+    import pandas as pd
+    from retriever import Reddit
+    from retriever.util.helpers import chunks
 
     ## Adjust logging if needed
     if args.debug:
@@ -121,8 +284,6 @@ def main():
     if args.log_file:
         LOGGER.addHandler(logging.FileHandler(args.log_file))
 
-    ## Initialize Reddit API Wrapper
-    reddit = Reddit(init_praw=args.use_praw, logger=LOGGER)
     ## Create Output Directory
     create_dir(args.output_dir)
     ## Get Date Range
@@ -136,7 +297,8 @@ def main():
     create_dir(SUBREDDIT_OUTDIR)
     create_dir(SUBREDDIT_SUBMISSION_OUTDIR)
 
-    ## Get subreddit info
+    ## Get subreddit info (Resume Runs Stay Offline: No API Init Before the File Checks)
+    reddit = None
     meta_file = f"{SUBREDDIT_OUTDIR}metadata.json.gz"
     if os.path.exists(meta_file):
         with gzip.open(meta_file, "rt") as f:
@@ -148,8 +310,9 @@ def main():
             DATE_RANGE = get_date_range(created,
                                         args.end_date,
                                         args.query_freq)
-    elif args.use_praw:
+    elif args.use_praw and not args.comments_only:
         LOGGER.info(f"Pulling subreddit metadata")
+        reddit = Reddit(init_praw=True, logger=LOGGER)
         meta = reddit.retrieve_subreddit_metadata(args.subreddit)
         meta["created_utc"] = str(pd.to_datetime(meta.get("created_utc"), unit="s"))
         with gzip.open(meta_file, "wt") as f:
@@ -163,27 +326,41 @@ def main():
                                         args.end_date,
                                         args.query_freq)
 
+    ## Initialize Reddit API Wrapper (After the Offline Skip-checks)
+    if reddit is None:
+        reddit = Reddit(init_praw=args.use_praw, logger=LOGGER)
+
     ## Identify Submission Data
     submission_files = []
     if not args.comments_only:
         LOGGER.info("Pulling Submissions")
         submission_counts = 0
-        for dstart, dstop in tqdm(list(zip(DATE_RANGE[:-1], DATE_RANGE[1:])), desc="Date Range", file=sys.stdout):
-            submission_file = f"{SUBREDDIT_SUBMISSION_OUTDIR}{dstart}_{dstop}.json.gz"
-            if os.path.exists(submission_file):
-                LOGGER.info(f"Skipping {submission_file} because it already exists.")
-                submission_files.append(submission_file)
-                continue
-            ## Query Submissions
-            subreddit_submissions = reddit.retrieve_subreddit_submissions(args.subreddit,
-                                                                          start_date=dstart,
-                                                                          end_date=dstop,
-                                                                          limit=None,
-                                                                          cols=SUBMISSION_COLS if args.limit_submission_metadata else None)
-            if subreddit_submissions is not None and not subreddit_submissions.empty:
-                submission_counts += len(subreddit_submissions)
-                subreddit_submissions.to_json(submission_file, orient="records", lines=True, compression="gzip")
-                submission_files.append(submission_file)
+        cols = SUBMISSION_COLS if args.limit_submission_metadata else None
+        ## Read the Directory Once Instead of stat()-ing per Window
+        existing_sub = set(os.listdir(SUBREDDIT_SUBMISSION_OUTDIR))
+        ## Windows are Independent -> Download Concurrently (Every Thread,
+        ## Including the Wrapper's Inner Workers, Gets Its Own PSAW Client)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {}
+            for dstart, dstop in zip(DATE_RANGE[:-1], DATE_RANGE[1:]):
+                submission_file = f"{SUBREDDIT_SUBMISSION_OUTDIR}{dstart}_{dstop}.json.gz"
+                if f"{dstart}_{dstop}.json.gz" in existing_sub:
+                    LOGGER.info(f"Skipping {submission_file} because it already exists.")
+                    submission_files.append(submission_file)
+                    continue
+                future = executor.submit(pull_submission_window,
+                                         reddit,
+                                         args.subreddit,
+                                         dstart,
+                                         dstop,
+                                         submission_file,
+                                         cols)
+                futures[future] = submission_file
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Date Range", file=sys.stdout):
+                n_written = future.result()
+                if n_written > 0:
+                    submission_counts += n_written
+                    submission_files.append(futures[future])
 
         LOGGER.info(
             "Found {:,d} submissions. Note this number does not include pre-pulled submissions".format(submission_counts))
@@ -197,31 +374,42 @@ def main():
     _ = create_dir(SUBREDDIT_COMMENTS_DIR)
     if not submission_files:
         submission_files = [f"{SUBREDDIT_SUBMISSION_OUTDIR}/{p}" for p in os.listdir(SUBREDDIT_SUBMISSION_OUTDIR)]
+    ## Identify Already-pulled link_ids: Sidecar Indices of the Sharded
+    ## Archives Plus Any Legacy Per-submission Files
+    existing_comments = set()
+    for fname in os.listdir(SUBREDDIT_COMMENTS_DIR):
+        if fname.endswith(".index"):
+            with open(f"{SUBREDDIT_COMMENTS_DIR}{fname}", "r") as f:
+                existing_comments.update(l.strip() for l in f)
+        elif fname.endswith(".json.gz"):
+            existing_comments.add(fname[:-len(".json.gz")])
     for sub_file in tqdm(submission_files, desc="Date Range", position=0, leave=False, file=sys.stdout):
-        subreddit_submissions = pd.read_json(sub_file, lines=True)
-        if subreddit_submissions.empty:
-            continue
-        if args.sample_percent < 1:
-            subreddit_submissions = subreddit_submissions.sample(frac=args.sample_percent,
-                                                                 random_state=args.random_state,
-                                                                 replace=False).reset_index(drop=True).copy()
-        link_ids = subreddit_submissions.loc[subreddit_submissions["num_comments"] > args.min_comments]["id"].tolist()
+        ## Stream Only the id/num_comments Fields Out of the Archive
+        link_ids = load_submission_link_ids(sub_file,
+                                            args.min_comments,
+                                            sample_percent=args.sample_percent,
+                                            random_state=args.random_state)
         # Skip submissions where comments were already pulled
         num_total_links = len(link_ids)
-        link_ids = [l for l in link_ids if not os.path.exists(f"{SUBREDDIT_COMMENTS_DIR}{l}.json.gz")]
+        link_ids = [l for l in link_ids if l not in existing_comments]
         num_processed_links = num_total_links - len(link_ids)
         LOGGER.info(f"Already processed comments from {num_processed_links} submissions. Skipping those.")
         if len(link_ids) == 0:
             continue
-        link_id_chunks = list(chunks(link_ids, args.chunksize))
-        for link_id_chunk in tqdm(link_id_chunks, desc="Submission Chunks", position=1, leave=False, file=sys.stdout):
-            link_df = reddit.retrieve_submission_comments(link_id_chunk)
-            for link_id in link_id_chunk:
-                link_file = f"{SUBREDDIT_COMMENTS_DIR}{link_id}.json.gz"
-                if link_df is not None and not link_df.empty:
-                    link_id_df = link_df.loc[link_df["link_id"] == f"t3_{link_id}"]
-                    if not link_id_df.empty:
-                        link_id_df.to_json(link_file, orient="records", lines=True, compression="gzip")
+        ## One Sharded Archive per Date Window Instead of One File per link_id
+        window = os.path.basename(sub_file)[:-len(".json.gz")]
+        archive_file = f"{SUBREDDIT_COMMENTS_DIR}{window}.jsonl.gz"
+        index_file = f"{SUBREDDIT_COMMENTS_DIR}{window}.index"
+        ## Chunks are Independent -> Download Concurrently (Writes Stay on the Main Thread)
+        with gzip.open(archive_file, "ab", compresslevel=1) as archive, open(index_file, "a") as index:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [executor.submit(pull_comment_chunk, reddit, link_id_chunk)
+                           for link_id_chunk in chunks(link_ids, args.chunksize)]
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Submission Chunks",
+                                   position=1, leave=False, file=sys.stdout):
+                    for link_id, link_id_df in future.result().items():
+                        append_jsonl_gz(link_id_df, archive)
+                        index.write(f"{link_id}\n")
 
     LOGGER.info("Script complete.")
 
@@ -5,20 +5,31 @@
 ## Standard Libary
 import sys
 import os
-import sys
+import io
 import jsonlines
 import gzip
+import queue
 import argparse
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import logging
 
 ## External
-import pandas as pd
 from tqdm import tqdm
 
-## Local
-from retriever import Reddit
-from retriever.util.helpers import chunks
+## External (Optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+## Local (Deferred: pandas and the retriever import chain dominate CLI
+## startup, so functions that need them import at call time and --help
+## stays fast)
 
 ####################
 ### Globals
@@ -28,6 +39,17 @@ from retriever.util.helpers import chunks
 logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger()
 
+## End-of-stream Marker for the Writer Thread
+WRITER_SENTINEL = object()
+
+## Target Number of Records per Query Window Under Adaptive Sizing
+WINDOW_TARGET_RECORDS = 5000
+MIN_WINDOW_DAYS = 7
+MAX_WINDOW_DAYS = 365
+
+## Per-process API Wrapper (PRAW Objects Are Not Picklable)
+_PROCESS_REDDIT = None
+
 
 ####################
 ### Functions
@@ -50,11 +72,19 @@ def parse_arguments():
     parser.add_argument("--output-dir", required=True, type=str, help="Path to output directory")
     parser.add_argument("--start-date", type=str, default=None, help="Start date for data")
     parser.add_argument("--end-date", type=str, default=None, help="End date for data")
-    parser.add_argument("--query-freq", type=str, default="1Y", help="How to break up the query")
+    parser.add_argument("--query-freq", type=str, default="auto",
+                        help="How to break up the query (pandas offset string, or 'auto' to size windows by the user's record count)")
     parser.add_argument("--use-praw", action="store_true", default=False,
                         help="Retrieve Official API data objects (at expense of query time) instead of Pushshift.io data")
     parser.add_argument("--chunksize", type=int, default=50,
                         help="Number of submissions to query comments from simultaneously")
+    parser.add_argument("--max-concurrent", type=int, default=16,
+                        help="Upper bound on concurrent API requests (the shared rate limiter still caps request rate)")
+    parser.add_argument("--compresslevel", type=int, default=4,
+                        help="gzip compression level for output archives (lower is faster, larger)")
+    parser.add_argument("--format", dest="output_format", choices=["jsonl.gz", "jsonl.zst", "parquet"],
+                        default="jsonl.gz",
+                        help="Output archive format (jsonl.zst requires zstandard, parquet requires pyarrow)")
     parser.add_argument("--sample-percent", type=float, default=1, help="Submission sample percent (0, 1]")
     parser.add_argument("--random-state", type=int, default=42, help="Sample seed for any submission sampling")
     parser.add_argument("--debug", action="store_true", help="Run script in debug mode.")
@@ -66,14 +96,357 @@ def parse_arguments():
 
 def create_dir(directory):
     """Create directory if it does not exist"""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    os.makedirs(directory, exist_ok=True)
+
+
+def _dump_jsonl(records,
+                buf):
+    """
+    Serialize records as JSONL bytes into an open binary buffer.
+    Uses orjson's C serializer when available, falling back to
+    jsonlines over stdlib json.
+
+    Args:
+        records (iterable of dict): Records to serialize
+        buf (file): Open binary buffer
+
+    Returns:
+        None
+    """
+    if orjson is not None:
+        for rec in records:
+            buf.write(orjson.dumps(rec, default=str, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    with io.TextIOWrapper(buf, encoding="utf-8") as txt:
+        writer = jsonlines.Writer(txt)
+        writer.write_all(records)
+        writer.close()
+
+
+def write_jsonl_gz(records,
+                   path,
+                   compresslevel=4):
+    """
+    Stream records into a gzipped JSONL file through a large write
+    buffer, without materializing them in a DataFrame first.
+
+    Args:
+        records (iterable of dict): Records to write
+        path (str): Output filepath (.json.gz / .jsonl.gz)
+        compresslevel (int): gzip compression level (default favors throughput)
+
+    Returns:
+        None
+    """
+    with gzip.open(path, "wb", compresslevel=compresslevel) as gz:
+        with io.BufferedWriter(gz, buffer_size=4 << 20) as buf:
+            _dump_jsonl(records, buf)
+
+
+def write_jsonl_zst(records,
+                    path):
+    """
+    Stream records into a zstd-compressed JSONL file. zstd's
+    cross-record dictionary reuse compresses repetitive Reddit JSON
+    better than gzip at a fraction of the CPU cost.
+
+    Args:
+        records (iterable of dict): Records to write
+        path (str): Output filepath (.jsonl.zst)
+
+    Returns:
+        None
+    """
+    if zstandard is None:
+        raise ImportError("The jsonl.zst output format requires the zstandard package")
+    with open(path, "wb") as f:
+        with zstandard.ZstdCompressor(level=1).stream_writer(f) as zw:
+            with io.BufferedWriter(zw, buffer_size=4 << 20) as buf:
+                _dump_jsonl(records, buf)
+
+
+def write_records(records,
+                  path,
+                  output_format="jsonl.gz",
+                  compresslevel=4):
+    """
+    Write records to an archive in the requested output format.
+
+    Args:
+        records (iterable of dict): Records to write
+        path (str): Output filepath
+        output_format (str): "jsonl.gz", "jsonl.zst", or "parquet"
+        compresslevel (int): gzip compression level (jsonl.gz only)
+
+    Returns:
+        None
+    """
+    if output_format == "jsonl.zst":
+        write_jsonl_zst(records, path)
+    elif output_format == "parquet":
+        ## Build the Arrow Table Straight From the Record Dicts (No
+        ## Pandas Round-trip); Writes Are Multi-threaded and Chunked
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pylist(list(records))
+        pq.write_table(table, path, compression="zstd", row_group_size=16384)
+    else:
+        write_jsonl_gz(records, path, compresslevel=compresslevel)
+
+
+def fetch_window(reddit,
+                 author,
+                 history_type,
+                 wstart,
+                 wstop):
+    """
+    Fetch one query window of a user's history as plain record
+    dictionaries, sorted chronologically. No DataFrame round-trip:
+    records stream from the API parser straight to the caller.
+
+    Args:
+        reddit (Reddit): Initialized API wrapper
+        author (str): Name of the subreddit user
+        history_type (str): "submissions" or "comments"
+        wstart (int): Window start epoch
+        wstop (int): Window stop epoch
+
+    Returns:
+        records (list of dict): JSON-safe window records
+    """
+    if history_type == "submissions":
+        iter_records = reddit.iter_author_submissions
+    else:
+        iter_records = reddit.iter_author_comments
+    ## Pass the Precomputed Window Directly (No Datetime Re-parsing)
+    records = list(iter_records(author,
+                                windows=[(wstart, wstop)]))
+    records.sort(key=lambda r: (r.get("created_utc") is None, r.get("created_utc")))
+    return records
+
+
+def fetch_window_records(author,
+                         history_type,
+                         wstart,
+                         wstop,
+                         use_praw,
+                         max_concurrent):
+    """
+    Fetch one query window of a user's history in a worker process.
+    Top-level (picklable) and backed by a per-process Reddit wrapper,
+    so PRAW's CPU-heavy JSON parsing spreads across cores.
+
+    Args:
+        author (str): Name of the subreddit user
+        history_type (str): "submissions" or "comments"
+        wstart (int): Window start epoch
+        wstop (int): Window stop epoch
+        use_praw (bool): Whether to initialize PRAW in the worker
+        max_concurrent (int): Worker-pool size for the wrapper
+
+    Returns:
+        records (list of dict): JSON-safe window records
+    """
+    from retriever import Reddit
+    global _PROCESS_REDDIT
+    if _PROCESS_REDDIT is None:
+        _PROCESS_REDDIT = Reddit(init_praw=use_praw, num_workers=max_concurrent, logger=LOGGER)
+    return fetch_window(_PROCESS_REDDIT,
+                        author,
+                        history_type,
+                        wstart,
+                        wstop)
+
+
+def resolve_query_freq(reddit,
+                       author,
+                       history_type,
+                       start_date,
+                       end_date,
+                       query_freq):
+    """
+    Resolve the "auto" query frequency into a concrete window size.
+
+    Pushshift pages are capped, so one fixed window size either
+    truncates heavy users or wastes requests on light ones. A single
+    size=0 count probe estimates the user's record density, and the
+    window is sized so each one holds roughly WINDOW_TARGET_RECORDS
+    records, bounded to [MIN_WINDOW_DAYS, MAX_WINDOW_DAYS].
+
+    Args:
+        reddit (Reddit): Initialized API wrapper
+        author (str): Name of the subreddit user
+        history_type (str): "submissions" or "comments"
+        start_date (str or None): Start date for data
+        end_date (str or None): End date for data
+        query_freq (str): Requested frequency ("auto" or a pandas offset)
+
+    Returns:
+        query_freq (str): Concrete pandas offset string (e.g. "90D")
+    """
+    if query_freq != "auto":
+        return query_freq
+    start_epoch = reddit._get_start_date(start_date)
+    end_epoch = reddit._get_end_date(end_date)
+    span_days = max((end_epoch - start_epoch) / 86400, 1)
+    try:
+        count = reddit._count(history_type.rstrip("s"),
+                              author=author,
+                              after=start_epoch,
+                              before=end_epoch)
+    except Exception as e:
+        LOGGER.warning(f"Count probe failed ({e}); falling back to {MAX_WINDOW_DAYS}D windows")
+        return f"{MAX_WINDOW_DAYS}D"
+    if count == 0:
+        return f"{MAX_WINDOW_DAYS}D"
+    days = span_days * WINDOW_TARGET_RECORDS / count
+    days = int(min(max(days, MIN_WINDOW_DAYS), MAX_WINDOW_DAYS))
+    LOGGER.info(f"Sized {history_type} windows at {days}D ({count} records over {span_days:.0f} days)")
+    return f"{days}D"
+
+
+def pull_author_history(reddit,
+                        author,
+                        history_type,
+                        outfile,
+                        start_date,
+                        end_date,
+                        query_freq,
+                        cache_dir,
+                        compresslevel=4,
+                        output_format="jsonl.gz",
+                        use_praw=False,
+                        max_concurrent=16):
+    """
+    Retrieve one side of a user's history (submissions or comments)
+    and write it to its archive file. Each query window is cached on
+    disk as its own shard, so interrupted runs resume without
+    re-downloading completed windows.
+
+    Args:
+        reddit (Reddit): Initialized API wrapper
+        author (str): Name of the subreddit user
+        history_type (str): "submissions" or "comments"
+        outfile (str): Output path for the archive
+        start_date (str or None): Start date for data
+        end_date (str or None): End date for data
+        query_freq (str): How to break up the query ("auto" sizes
+                windows from a count probe)
+        cache_dir (str): Directory holding per-window cache shards
+        compresslevel (int): gzip compression level for output and shards
+        output_format (str): Output archive format (cache shards stay jsonl.gz)
+        use_praw (bool): Under PRAW, fan uncached windows across processes
+        max_concurrent (int): Worker-pool size for per-process wrappers
+
+    Returns:
+        n (int): Number of records written (0 if the user had none)
+    """
+    ## Resolve the Same Window Boundaries the Wrapper Would Use
+    query_freq = resolve_query_freq(reddit,
+                                    author,
+                                    history_type,
+                                    start_date,
+                                    end_date,
+                                    query_freq)
+    time_chunks = reddit._chunk_timestamps(reddit._get_start_date(start_date),
+                                           reddit._get_end_date(end_date),
+                                           query_freq)
+    counts = []
+    window_pairs = list(zip(time_chunks[:-1], time_chunks[1:]))
+
+    def shard_path(wstart, wstop):
+        """Cache shard path for one window"""
+        return f"{cache_dir}/{author}_{history_type}_{wstart}_{wstop}.jsonl.gz"
+
+    ## Under PRAW, JSON Parsing is CPU-heavy: Fan Uncached Windows Across
+    ## Processes and Collect Them In Order Below
+    process_pool = None
+    window_futures = {}
+    if use_praw:
+        uncached = [(ws, wt) for ws, wt in window_pairs if not os.path.exists(shard_path(ws, wt))]
+        if len(uncached) > 1:
+            process_pool = ProcessPoolExecutor(max_workers=min(len(uncached), os.cpu_count()))
+            window_futures = {(ws, wt):process_pool.submit(fetch_window_records,
+                                                           author,
+                                                           history_type,
+                                                           ws,
+                                                           wt,
+                                                           use_praw,
+                                                           max_concurrent)
+                              for ws, wt in uncached}
+
+    def iter_window_records():
+        """Yield records window by window, caching fetched shards on disk"""
+        for wstart, wstop in tqdm(window_pairs,
+                                  total=len(window_pairs),
+                                  desc=f"{author} {history_type} windows",
+                                  file=sys.stdout):
+            cache_path = shard_path(wstart, wstop)
+            if os.path.exists(cache_path):
+                ## Stream Cached Shards Record by Record (No Per-window List)
+                n_window = 0
+                with gzip.open(cache_path, "rt") as f:
+                    for record in jsonlines.Reader(f):
+                        n_window += 1
+                        yield record
+                counts.append(n_window)
+                continue
+            if (wstart, wstop) in window_futures:
+                records = window_futures[(wstart, wstop)].result()
+            else:
+                records = fetch_window(reddit,
+                                       author,
+                                       history_type,
+                                       wstart,
+                                       wstop)
+            ## Write the Shard Atomically so Crashes Never Leave Bad Cache Entries
+            tmp_path = f"{cache_path}.tmp"
+            write_jsonl_gz(records, tmp_path, compresslevel=compresslevel)
+            os.rename(tmp_path, cache_path)
+            counts.append(len(records))
+            yield from records
+
+    ## Stream Into the Output Archive Through a Dedicated Writer Thread,
+    ## so Compression Overlaps the Next Window's Fetch
+    record_queue = queue.Queue(maxsize=1000)
+    errors = []
+
+    def run_writer():
+        try:
+            write_records(iter(record_queue.get, WRITER_SENTINEL),
+                          outfile,
+                          output_format=output_format,
+                          compresslevel=compresslevel)
+        except Exception as e:
+            errors.append(e)
+            ## Drain so the Producer Never Blocks on a Dead Writer
+            while record_queue.get() is not WRITER_SENTINEL:
+                pass
+
+    writer_thread = threading.Thread(target=run_writer)
+    writer_thread.start()
+    try:
+        for record in iter_window_records():
+            record_queue.put(record)
+    finally:
+        record_queue.put(WRITER_SENTINEL)
+        writer_thread.join()
+        if process_pool is not None:
+            process_pool.shutdown()
+    if errors:
+        raise errors[0]
+    n = sum(counts)
+    if n == 0:
+        os.remove(outfile)
+    return n
 
 
 def main():
     """Main program"""
     ## Parse Arguments
     args = parse_arguments()
+    ## Heavy Imports, Deferred Until Arguments Are Valid
+    from retriever import Reddit
 
     ## Adjust logging if needed
     if args.debug:
@@ -81,44 +454,46 @@ def main():
     if args.log_file:
         LOGGER.addHandler(logging.FileHandler(args.log_file))
 
-    ## Initialize Reddit API Wrapper
-    reddit = Reddit(init_praw=args.use_praw, logger=LOGGER)
-    ## Create Output Directory
+    ## Initialize Reddit API Wrapper (Concurrency Capped Separately from Request Rate)
+    reddit = Reddit(init_praw=args.use_praw, num_workers=args.max_concurrent, logger=LOGGER)
+    ## Create Output and Window-cache Directories
     create_dir(args.output_dir)
+    cache_dir = f"{args.output_dir}/.cache"
+    create_dir(cache_dir)
 
     LOGGER.info(f"\nStarting Query for u/{args.author}")
-    submission_file = f"{args.output_dir}/{args.author}_submissions.json.gz"
-    comment_file = f"{args.output_dir}/{args.author}_comments.json.gz"
-
-    ## Identify Submission Data
-    LOGGER.info("Pulling Submissions")
-    if not os.path.exists(submission_file):
-        author_submissions = reddit.retrieve_author_submissions(args.author,
-                                                                start_date=args.start_date,
-                                                                end_date=args.end_date,
-                                                                chunksize=args.query_freq)
-        if author_submissions is not None:
-            LOGGER.info(f"u/{args.author} has {len(author_submissions):,} submissions")
-            author_submissions.to_json(submission_file, orient="records", lines=True, compression="gzip")
-        else:
-            LOGGER.info(f"u/{args.author} has 0 submissions")
-    else:
-        LOGGER.info(f"{submission_file} already exists. Skipping.")
-
-    ## Identify Comment Data
-    LOGGER.info("Pulling Comments")
-    if not os.path.exists(comment_file):
-        author_comments = reddit.retrieve_author_comments(args.author,
-                                                          start_date=args.start_date,
-                                                          end_date=args.end_date,
-                                                          chunksize=args.query_freq)
-        if author_comments is not None:
-            LOGGER.info(f"u/{args.author} has {len(author_comments):,} comments")
-            author_comments.to_json(comment_file, orient="records", lines=True, compression="gzip")
-        else:
-            LOGGER.info(f"u/{args.author} has 0 comments")
-    else:
-        LOGGER.info(f"{comment_file} already exists. Skipping.")
+    extension = {"jsonl.gz":"json.gz", "jsonl.zst":"jsonl.zst", "parquet":"parquet"}[args.output_format]
+    submission_file = f"{args.output_dir}/{args.author}_submissions.{extension}"
+    comment_file = f"{args.output_dir}/{args.author}_comments.{extension}"
+
+    ## Pull Submissions and Comments Concurrently (Independent Queries;
+    ## Each Thread Pages Through Its Own Thread-local PSAW Client)
+    targets = {"submissions":submission_file,
+               "comments":comment_file}
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {}
+        for history_type, outfile in targets.items():
+            if os.path.exists(outfile):
+                LOGGER.info(f"{outfile} already exists. Skipping.")
+                continue
+            LOGGER.info(f"Pulling {history_type.capitalize()}")
+            future = executor.submit(pull_author_history,
+                                     reddit,
+                                     args.author,
+                                     history_type,
+                                     outfile,
+                                     args.start_date,
+                                     args.end_date,
+                                     args.query_freq,
+                                     cache_dir,
+                                     args.compresslevel,
+                                     args.output_format,
+                                     args.use_praw,
+                                     args.max_concurrent)
+            futures[future] = history_type
+        for future in as_completed(futures):
+            n_written = future.result()
+            LOGGER.info(f"u/{args.author} has {n_written:,} {futures[future]}")
 
     LOGGER.info("Script complete.")
 